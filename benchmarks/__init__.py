@@ -0,0 +1,2 @@
+# Scripts de medición de rendimiento. Se ejecutan como módulos desde la raíz del
+# proyecto, por ejemplo: python -m benchmarks.scaling
@@ -0,0 +1,80 @@
+# Generador de instancias sintéticas reproducibles para los benchmarks: con la misma
+# configuración y la misma semilla se obtiene exactamente el mismo problema.
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from core.datasets import compatibility_matrix, load_dataset
+from core.instance import ProblemInstance, build_room, edges_from_pairs
+from core.models import Student
+
+# Distancias óptimas posibles para los estudiantes con necesidades de visión.
+VISION_DISTANCES = (2.0, 2.5, 3.0, 3.5, 4.0, 5.0, 6.0, 8.0)
+
+@dataclass
+class BenchmarkInstance:
+    name: str
+    students: list
+    seats: list
+    seat_distances: dict
+    conflict_edges: tuple  # (conflict_i, conflict_j) con i < j.
+
+    @property
+    def compatibility_matrix(self):
+        """Matriz n x n para las funciones que la necesitan; solo se construye si se pide."""
+        pairs = zip(self.conflict_edges[0].tolist(), self.conflict_edges[1].tolist())
+        return compatibility_matrix(len(self.students), pairs)
+
+    def problem(self):
+        return ProblemInstance(self.students, self.seats, None, self.seat_distances,
+                               conflict_edges=self.conflict_edges)
+
+def generate_instance(num_students, rows, cols, conflict_density=0.01, vision_share=0.4,
+                      first_distance=2.0, row_spacing=1.0, seed=0, name=None):
+    """
+    Instancia sintética: `num_students` estudiantes en un aula de `rows` x `cols`.
+    `conflict_density` es la fracción de todas las parejas posibles que son incompatibles
+    y `vision_share` la fracción de estudiantes con una distancia óptima (el resto tiene
+    visión normal).
+    """
+    if num_students > rows * cols:
+        raise ValueError(f"{num_students} estudiantes no caben en un aula de {rows} x {cols}")
+    rng = np.random.default_rng(seed)
+    seats, seat_distances = build_room(rows, cols, first_distance, row_spacing)
+
+    optimas = np.zeros(num_students)
+    needs = rng.random(num_students) < vision_share
+    optimas[needs] = rng.choice(VISION_DISTANCES, size=int(needs.sum()))
+    students = [Student(f"E{i + 1}", float(optimas[i]), i) for i in range(num_students)]
+
+    # Se muestrean parejas al azar hasta juntar las que pide la densidad (sin repetidos).
+    possible = num_students * (num_students - 1) // 2
+    target = min(int(round(conflict_density * possible)), possible)
+    conflict_i = np.zeros(0, dtype=np.intp)
+    conflict_j = np.zeros(0, dtype=np.intp)
+    while len(conflict_i) < target:
+        pairs = rng.integers(0, num_students, size=(2 * (target - len(conflict_i)), 2))
+        known = np.column_stack([conflict_i, conflict_j])
+        conflict_i, conflict_j = edges_from_pairs(np.concatenate([known, pairs]))
+    if len(conflict_i) > target:
+        keep = np.sort(rng.choice(len(conflict_i), size=target, replace=False))
+        conflict_i, conflict_j = conflict_i[keep], conflict_j[keep]
+
+    name = name or f"n{num_students}_{rows}x{cols}"
+    return BenchmarkInstance(name, students, seats, seat_distances, (conflict_i, conflict_j))
+
+def square_instance(seats_count, occupancy=0.9, conflicts_per_student=2, seed=0):
+    """Aula casi cuadrada de al menos `seats_count` asientos, con ocupación y conflictos por estudiante fijos."""
+    cols = math.ceil(math.sqrt(seats_count))
+    rows = math.ceil(seats_count / cols)
+    num_students = int(occupancy * rows * cols)
+    density = 2 * conflicts_per_student / max(num_students - 1, 1)
+    return generate_instance(num_students, rows, cols, conflict_density=density, seed=seed)
+
+def dataset_instance(students_file, compat_file, rows=5, cols=6, name='dataset'):
+    """Instancia a partir de un par de CSV en el formato de la carpeta 'datasets'."""
+    students, _, pairs = load_dataset(students_file, compat_file)
+    seats, seat_distances = build_room(rows, cols)
+    return BenchmarkInstance(name, students, seats, seat_distances, edges_from_pairs(pairs))
@@ -0,0 +1,60 @@
+# Escalamiento de la evaluación con el tamaño del aula: para aulas cada vez más grandes
+# mide el tiempo de compilar la instancia y de evaluar una población completa.
+# Uso: python -m benchmarks.scaling [--sizes 100 1000 5000] [--pop-size 100]
+
+import argparse
+import math
+import time
+
+import numpy as np
+
+from benchmarks.instances import square_instance
+
+def _best_time(function, repeats):
+    best = math.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run(sizes, pop_size=100, repeats=5, seed=0):
+    """Devuelve una fila de resultados por tamaño de aula."""
+    results = []
+    for size in sizes:
+        benchmark = square_instance(size, seed=seed)
+        start = time.perf_counter()
+        instance = benchmark.problem()
+        build_time = time.perf_counter() - start
+
+        rng = np.random.default_rng(seed)
+        genes = np.argsort(rng.random((pop_size, instance.seats_count)), axis=1)[:, :instance.num_students]
+        eval_time = _best_time(lambda: instance.evaluate_population(genes), repeats)
+        work = instance.num_students + len(instance.conflict_i) + instance.seats_count
+        results.append({
+            'seats': instance.seats_count,
+            'students': instance.num_students,
+            'conflicts': len(instance.conflict_i),
+            'build_s': build_time,
+            'eval_ms_per_individual': 1000 * eval_time / pop_size,
+            'ns_per_unit': 1e9 * eval_time / (pop_size * work),
+        })
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Escalamiento de la evaluación con el tamaño del aula.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 250, 500, 1000, 2000, 5000])
+    parser.add_argument('--pop-size', type=int, default=100)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    print(f"{'asientos':>9} {'estud.':>7} {'confl.':>7} {'compilar s':>11} {'ms/indiv.':>10} {'ns/unidad':>10}")
+    for row in run(args.sizes, args.pop_size, args.repeats, args.seed):
+        print(f"{row['seats']:>9} {row['students']:>7} {row['conflicts']:>7} {row['build_s']:>11.4f} "
+              f"{row['eval_ms_per_individual']:>10.4f} {row['ns_per_unit']:>10.2f}")
+    print("ns/unidad = tiempo por individuo / (estudiantes + conflictos + asientos); "
+          "si es casi constante, la evaluación escala linealmente.")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+# Tiempo de arranque: importa cada módulo en un intérprete nuevo con `python -X importtime`
+# y reporta el tiempo total de importación, los módulos más lentos y si se cargó algún
+# paquete prohibido (Qt o matplotlib en el solucionador). Sale con código 1 si hay una
+# regresión, para poder usarlo en integración continua.
+# Uso: python -m benchmarks.startup [--budget-ms 300] [--top 5]
+
+import argparse
+import os
+import subprocess
+import sys
+
+# Módulo -> paquetes que no debe cargar al importarse.
+DEFAULT_TARGETS = {
+    'core.genetic': ('PySide6', 'matplotlib'),
+    'core.islands': ('PySide6', 'matplotlib'),
+    'core.batch': ('PySide6', 'matplotlib'),
+    'gui.plot': ('PySide6', 'matplotlib'),
+    'gui.evolution_plot': ('PySide6', 'matplotlib'),
+    'main': ('PySide6', 'matplotlib'),
+}
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def import_times(module, repeats=3):
+    """
+    Importa `module` en `repeats` intérpretes nuevos y devuelve el mejor resultado como
+    (total_us, tiempos), donde `tiempos` es {módulo importado: (propio_us, acumulado_us)}.
+    """
+    best = None
+    for _ in range(repeats):
+        completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                                   cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+        times = {}
+        for line in completed.stderr.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            self_us, cumulative_us, name = line[len('import time:'):].split('|')
+            times[name.strip()] = (int(self_us), int(cumulative_us))
+        # El total es la suma del tiempo propio de todo lo que se importó.
+        total = sum(self_us for self_us, _ in times.values())
+        if best is None or total < best[0]:
+            best = (total, times)
+    return best
+
+def check(targets, budget_ms=None, top=5, repeats=3):
+    """Imprime el reporte y devuelve la lista de problemas encontrados."""
+    problems = []
+    for module, forbidden in targets.items():
+        total, times = import_times(module, repeats)
+        loaded = sorted({name.split('.')[0] for name in times} & set(forbidden))
+        print(f"{module:<22} {total / 1000:>8.1f} ms  ({len(times)} módulos)")
+        slowest = sorted(times.items(), key=lambda item: item[1][0], reverse=True)[:top]
+        for name, (self_us, _) in slowest:
+            print(f"    {self_us / 1000:>8.1f} ms  {name}")
+        if loaded:
+            problems.append(f"{module} carga {', '.join(loaded)}")
+        if budget_ms is not None and total / 1000 > budget_ms:
+            problems.append(f"{module} tarda {total / 1000:.1f} ms (límite {budget_ms} ms)")
+    return problems
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tiempo de importación de los módulos del proyecto.")
+    parser.add_argument('modules', nargs='*', help="Módulos a medir (por defecto, los del solucionador)")
+    parser.add_argument('--budget-ms', type=float, default=None, help="Tiempo máximo de importación por módulo")
+    parser.add_argument('--top', type=int, default=5, help="Cuántos de los módulos más lentos mostrar")
+    parser.add_argument('--repeats', type=int, default=3, help="Intérpretes por módulo (se toma el mejor)")
+    args = parser.parse_args(argv)
+
+    targets = {module: DEFAULT_TARGETS.get(module, ()) for module in args.modules} or DEFAULT_TARGETS
+    problems = check(targets, args.budget_ms, args.top, args.repeats)
+    for problem in problems:
+        print(f"[REGRESIÓN] {problem}")
+    return 1 if problems else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,181 @@
+# Suite de benchmarks reproducible: para un conjunto fijo de instancias (sintéticas con
+# semilla, más el dataset de ejemplo) mide la evaluación y el algoritmo genético y guarda
+# los resultados en JSON, para comparar entre commits.
+# Uso: python -m benchmarks.suite [-o resultados.json] [--compare anterior.json] [--quick]
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+
+from benchmarks.instances import dataset_instance, generate_instance
+from core.genetic import Individual, evaluate, solve
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Casos de la suite. `target` es el fitness para medir el tiempo hasta alcanzarlo.
+CASES = [
+    {'name': 'dataset', 'target': 0.947, 'ngen': 150, 'pop_size': 200},
+    {'name': 'small', 'instance': dict(num_students=40, rows=6, cols=8, conflict_density=0.02),
+     'target': 0.93, 'ngen': 150, 'pop_size': 200},
+    {'name': 'medium', 'instance': dict(num_students=200, rows=15, cols=15, conflict_density=0.005),
+     'target': 0.65, 'ngen': 150, 'pop_size': 200},
+    {'name': 'large', 'instance': dict(num_students=1000, rows=30, cols=40, conflict_density=0.002),
+     'target': 0.53, 'ngen': 60, 'pop_size': 200},
+]
+QUICK_CASES = ('dataset', 'small')
+
+def build_instance(case, seed):
+    if 'instance' not in case:
+        datasets = os.path.join(PROJECT_ROOT, 'datasets')
+        return dataset_instance(os.path.join(datasets, 'students_dataset.csv'),
+                                os.path.join(datasets, 'compatibility_dataset.csv'))
+    return generate_instance(seed=seed, name=case['name'], **case['instance'])
+
+def _random_population(benchmark, size, seed):
+    rng = np.random.default_rng(seed)
+    seats_count = len(benchmark.seats)
+    return np.argsort(rng.random((size, seats_count)), axis=1)[:, :len(benchmark.students)]
+
+def _rate(function, count, min_time=0.2):
+    # Repite la llamada hasta acumular `min_time` segundos; devuelve unidades por segundo.
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        function()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return calls * count / elapsed
+
+def bench_evaluate(benchmark, seed, pop_size=200, scalar_samples=20):
+    """Evaluaciones por segundo de evaluate() (un individuo) y de la evaluación por lotes."""
+    problem = benchmark.problem()
+    genes = _random_population(benchmark, pop_size, seed)
+    individuals = [Individual(list(row)) for row in genes[:scalar_samples]]
+    d_max = max(benchmark.seat_distances.values())
+
+    def scalar():
+        for individual in individuals:
+            evaluate(individual, benchmark.students, benchmark.seats, None, benchmark.seat_distances, d_max,
+                     conflict_edges=benchmark.conflict_edges)
+
+    return {
+        'evaluate_per_s': _rate(scalar, len(individuals)),
+        'evaluate_population_per_s': _rate(lambda: problem.evaluate_population(genes), pop_size),
+    }
+
+def bench_run_ga(benchmark, case, seed, repeats=3):
+    """
+    Generaciones y evaluaciones por segundo y tiempo hasta el fitness objetivo. Con la
+    misma semilla todas las repeticiones hacen el mismo trabajo; se toma la más rápida.
+    """
+    problem = benchmark.problem()
+    result = None
+    for _ in range(repeats):
+        reached = []
+
+        def on_generation(event):
+            if not reached and event.best_fitness >= case['target']:
+                reached.append(event.elapsed)
+
+        run = solve(benchmark.students, benchmark.seats, None, benchmark.seat_distances, [1],
+                    ngen=case['ngen'], pop_size=case['pop_size'], seed=seed, instance=problem,
+                    verbose=False, on_generation=on_generation)
+        if result is None or run.elapsed < result.elapsed:
+            result, time_to_target = run, (reached[0] if reached else None)
+
+    # Una ejecución más, idéntica y con tracemalloc, solo para la memoria pico.
+    tracemalloc.start()
+    solve(benchmark.students, benchmark.seats, None, benchmark.seat_distances, [1],
+          ngen=case['ngen'], pop_size=case['pop_size'], seed=seed, instance=problem, verbose=False)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'generations': result.generations,
+        'evaluations': result.evaluations,
+        'elapsed_s': result.elapsed,
+        'generations_per_s': result.generations / result.elapsed,
+        'evaluations_per_s': result.evaluations / result.elapsed,
+        'best_fitness': result.fitness[0],
+        'target_fitness': case['target'],
+        'time_to_target_s': time_to_target,
+        'peak_memory_mb': peak / 2 ** 20,
+    }
+
+def _git_commit():
+    try:
+        completed = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+                                   capture_output=True, text=True, check=True)
+        return completed.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_suite(cases=CASES, seed=0, repeats=3):
+    results = []
+    for case in cases:
+        benchmark = build_instance(case, seed)
+        row = {'case': case['name'], 'students': len(benchmark.students), 'seats': len(benchmark.seats),
+               'conflicts': len(benchmark.conflict_edges[0])}
+        row.update(bench_evaluate(benchmark, seed))
+        row.update(bench_run_ga(benchmark, case, seed, repeats))
+        results.append(row)
+        print(f"{row['case']:<8} eval {row['evaluate_population_per_s']:>12,.0f}/s  "
+              f"gen {row['generations_per_s']:>8.1f}/s  mem {row['peak_memory_mb']:>7.1f} MB  "
+              f"fitness {row['best_fitness']:.4f}  objetivo "
+              + (f"{row['time_to_target_s']:.3f} s" if row['time_to_target_s'] is not None else "no alcanzado"))
+    return {
+        'meta': {
+            'commit': _git_commit(),
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'seed': seed,
+        },
+        'results': results,
+    }
+
+def compare(previous, current):
+    """Imprime el cambio relativo de las métricas principales respecto a un resultado anterior."""
+    before = {row['case']: row for row in previous['results']}
+    print(f"Comparación con {previous['meta'].get('commit')} ({previous['meta'].get('timestamp')}):")
+    for row in current['results']:
+        old = before.get(row['case'])
+        if old is None:
+            continue
+        changes = []
+        for metric in ('evaluate_population_per_s', 'generations_per_s', 'peak_memory_mb', 'time_to_target_s'):
+            if old.get(metric) and row.get(metric) is not None:
+                changes.append(f"{metric} {100 * (row[metric] / old[metric] - 1):+.1f}%")
+        print(f"  {row['case']:<8} " + ", ".join(changes))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Suite de benchmarks del algoritmo genético.")
+    parser.add_argument('-o', '--output', default='benchmark_results.json', help="Archivo JSON de salida")
+    parser.add_argument('--compare', default=None, help="JSON de una corrida anterior para comparar")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeats', type=int, default=3, help="Ejecuciones del AG por caso (se toma la más rápida)")
+    parser.add_argument('--quick', action='store_true', help="Solo los casos pequeños")
+    args = parser.parse_args(argv)
+
+    cases = [case for case in CASES if not args.quick or case['name'] in QUICK_CASES]
+    report = run_suite(cases, args.seed, args.repeats)
+    with open(args.output, mode='w', encoding='utf-8') as outfile:
+        json.dump(report, outfile, indent=2)
+    print(f"Resultados guardados en '{args.output}'.")
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as infile:
+            compare(json.load(infile), report)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,88 @@
+# Modo por lotes: resuelve todas las secciones (pares de CSV) de un directorio en un
+# pool de procesos, sin interfaz gráfica, y escribe los resultados en archivos.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from core.datasets import find_datasets, load_dataset, write_assignment, write_json
+from core.genetic import solve
+from core.instance import ProblemInstance, build_room, edges_from_pairs
+
+def _solve_section(task):
+    """
+    Resuelve una sección (ver _run_section). Un error en una sección, p. ej. un CSV mal
+    formado, no detiene el lote: queda en su resumen como {'name': ..., 'error': ...}.
+    """
+    try:
+        return _run_section(*task)
+    except Exception as e:
+        return {'name': task[0], 'error': f"{type(e).__name__}: {e}"}
+
+def _run_section(name, students_file, compat_file, output_dir, room, seed, chart_format, ga_settings):
+    """
+    Resuelve una sección y escribe '<nombre>_assignment.csv' y '<nombre>_logbook.json',
+    y con `chart_format` también el plano '<nombre>_layout.<formato>'.
+    """
+    students, ids, pairs = load_dataset(students_file, compat_file)
+    seats, seat_distances = build_room(**room)
+    summary = {'name': name, 'students': len(students), 'seats': len(seats), 'conflicts': len(pairs)}
+    if len(students) > len(seats):
+        summary['error'] = f"El aula ({len(seats)} asientos) no alcanza para {len(students)} estudiantes"
+        return summary
+
+    instance = ProblemInstance(students, seats, None, seat_distances, conflict_edges=edges_from_pairs(pairs))
+    result = solve(students, seats, None, seat_distances, [1], seed=seed, instance=instance,
+                   verbose=False, **ga_settings)
+
+    assignment_file = os.path.join(output_dir, f"{name}_assignment.csv")
+    logbook_file = os.path.join(output_dir, f"{name}_logbook.json")
+    write_assignment(assignment_file, students, ids, seats, seat_distances, result.solutions[0])
+    summary.update({
+        'fitness': result.fitness[0],
+        'stop_reason': result.stop_reason,
+        'generations': result.generations,
+        'evaluations': result.evaluations,
+        'elapsed': result.elapsed,
+        'assignment_file': assignment_file,
+        'logbook_file': logbook_file,
+    })
+    if chart_format:
+        # Se importa aquí: sin planos el modo por lotes no carga matplotlib.
+        from gui.plot import export_layout
+
+        chart_file = os.path.join(output_dir, f"{name}_layout.{chart_format}")
+        export_layout(chart_file, seats, result.solutions[0], students, f"Plano de la sección {name}")
+        summary['chart_file'] = chart_file
+    write_json(logbook_file, {**summary, 'solutions': result.solutions, 'solution_fitness': result.fitness,
+                              'logbook': result.logbook})
+    return summary
+
+def solve_directory(directory, output_dir, rows=5, cols=6, first_distance=2.0, row_spacing=1.0,
+                    processes=None, seed=None, chart_format=None, **ga_settings):
+    """
+    Resuelve cada par 'students_<nombre>.csv' / 'compatibility_<nombre>.csv' de `directory`
+    en el aula de `rows` x `cols` (ver build_room) y escribe en `output_dir` la asignación
+    (CSV) y el logbook (JSON) de cada sección, más un 'summary.json' con todas.
+    Las secciones se reparten en un pool de `processes` procesos (1 = en este proceso).
+    Cada sección recibe su propia semilla derivada de `seed`, así que el resultado no
+    depende del número de procesos. Con `chart_format` ('png', 'svg' o 'pdf') se exporta
+    además el plano de cada sección (gui.plot.export_layout, sin pantalla).
+    `ga_settings` se pasa tal cual a solve().
+    Devuelve la lista de resúmenes (uno por sección, con 'error' si no se pudo resolver).
+    """
+    datasets = find_datasets(directory)
+    os.makedirs(output_dir, exist_ok=True)
+    room = {'rows': rows, 'cols': cols, 'first_distance': first_distance, 'row_spacing': row_spacing}
+    seeds = np.random.SeedSequence(seed).spawn(len(datasets))
+    tasks = [(name, students_file, compat_file, output_dir, room, section_seed, chart_format, ga_settings)
+             for (name, students_file, compat_file), section_seed in zip(datasets, seeds)]
+
+    if processes == 1:
+        summaries = list(map(_solve_section, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            summaries = list(executor.map(_solve_section, tasks))
+    write_json(os.path.join(output_dir, 'summary.json'), summaries)
+    return summaries
@@ -0,0 +1,55 @@
+# Caché de fitness: evita volver a evaluar cromosomas que ya se evaluaron antes
+# (por ejemplo, hijos que no pasaron por cruce ni mutación y son copias de su padre).
+
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+def chromosome_key(assignment):
+    """Huella compacta (16 bytes) de una asignación estudiante -> asiento."""
+    return hashlib.blake2b(np.asarray(assignment, dtype=np.int64).tobytes(), digest_size=16).digest()
+
+class FitnessCache:
+    """
+    Caché LRU acotada de fitness indexada por la huella del cromosoma.
+    Cuenta aciertos y fallos para poder registrarlos en el logbook.
+    """
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key):
+        fitness = self._data.get(key)
+        if fitness is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return fitness
+
+    def put(self, key, fitness):
+        self._data[key] = fitness
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def counters(self):
+        return self.hits, self.misses
+
+    def items(self):
+        """Pares (huella, fitness) del menos al más reciente (orden LRU)."""
+        return list(self._data.items())
+
+    @classmethod
+    def from_items(cls, maxsize, items, hits=0, misses=0):
+        cache = cls(maxsize)
+        cache._data.update(items)
+        cache.hits = hits
+        cache.misses = misses
+        return cache
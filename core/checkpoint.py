@@ -0,0 +1,88 @@
+# Puntos de control del algoritmo genético: guardan en un .npz todo el estado de una
+# ejecución (población, fitness, estado de ambos generadores aleatorios, contadores,
+# logbook, hall-of-fame y caché) para poder continuarla exactamente donde quedó.
+# Los datos del problema no se guardan: al reanudar se vuelven a pasar.
+
+import json
+import os
+
+import numpy as np
+
+from core.cache import FitnessCache
+from core.hall_of_fame import HallOfFame
+
+CHECKPOINT_VERSION = 1
+
+def _to_json(value):
+    # Los escalares de NumPy del logbook se guardan como números de Python (sin pérdida).
+    return json.dumps(value, default=lambda item: item.item())
+
+def save_checkpoint(path, settings, population, rng, py_rng, hof, cache, logbook, counters, num_students):
+    """
+    Escribe el punto de control en `path`. `settings` son los parámetros de la ejecución
+    y `counters` el resto del estado del ciclo (gen, evaluations, best_fitness, stall,
+    gen_time, elapsed); `num_students` es el largo de las asignaciones del hall-of-fame. Se escribe a un archivo temporal y luego se renombra, así que
+    una interrupción a medio guardar no estropea el punto de control anterior.
+    """
+    hof_entries, hof_seq = hof.entries()
+    cache_items = cache.items() if cache is not None else []
+    meta = {
+        'version': CHECKPOINT_VERSION,
+        'settings': settings,
+        'counters': counters,
+        'rng_state': rng.bit_generator.state,
+        'py_rng_state': py_rng.getstate(),
+        'hof_maxsize': hof.maxsize,
+        'hof_seq': hof_seq,
+        'cache': None if cache is None else {'maxsize': cache.maxsize, 'hits': cache.hits, 'misses': cache.misses},
+    }
+    arrays = {
+        'meta': np.array(_to_json(meta)),
+        'logbook': np.array(_to_json(logbook)),
+        'genes': population.genes,
+        'fitness': population.fitness,
+        'hof_fitness': np.array([fitness for fitness, _, _ in hof_entries], dtype=np.float64),
+        'hof_order': np.array([order for _, order, _ in hof_entries], dtype=np.int64),
+        # Forma explícita (k, n): un hall-of-fame vacío se guarda como (0, n) y no como un arreglo plano.
+        'hof_assignments': np.array([assignment for _, _, assignment in hof_entries],
+                                    dtype=np.int64).reshape(len(hof_entries), num_students),
+        # Huellas de 16 bytes como matriz uint8 (un dtype 'S16' recortaría ceros finales).
+        'cache_keys': np.frombuffer(b''.join(key for key, _ in cache_items), dtype=np.uint8).reshape(-1, 16),
+        'cache_fitness': np.array([fitness for _, fitness in cache_items], dtype=np.float64),
+    }
+    temporary = f"{path}.tmp"
+    with open(temporary, mode='wb') as outfile:
+        np.savez_compressed(outfile, **arrays)
+    os.replace(temporary, path)
+
+def load_checkpoint(path):
+    """
+    Lee un punto de control escrito por save_checkpoint(). Devuelve un diccionario con
+    'settings', 'counters', 'logbook', 'genes', 'fitness', 'rng_state', 'py_rng_state',
+    'hof' (HallOfFame) y 'cache' (FitnessCache o None), listo para iter_ga(resume_from=...).
+    """
+    with np.load(path, allow_pickle=False) as data:
+        meta = json.loads(str(data['meta']))
+        if meta.get('version') != CHECKPOINT_VERSION:
+            raise ValueError(f"Versión de punto de control no soportada: {meta.get('version')}")
+        hof = HallOfFame.from_entries(meta['hof_maxsize'],
+                                      zip(data['hof_fitness'].tolist(), data['hof_order'].tolist(),
+                                          data['hof_assignments']),
+                                      meta['hof_seq'])
+        cache = None
+        if meta['cache'] is not None:
+            items = zip((row.tobytes() for row in data['cache_keys']), data['cache_fitness'].tolist())
+            cache = FitnessCache.from_items(meta['cache']['maxsize'], items,
+                                            meta['cache']['hits'], meta['cache']['misses'])
+        version, internal, gauss = meta['py_rng_state']
+        return {
+            'settings': meta['settings'],
+            'counters': meta['counters'],
+            'logbook': json.loads(str(data['logbook'])),
+            'genes': data['genes'].astype(np.intp),
+            'fitness': data['fitness'].copy(),
+            'rng_state': meta['rng_state'],
+            'py_rng_state': (version, tuple(internal), gauss),
+            'hof': hof,
+            'cache': cache,
+        }
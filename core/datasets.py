@@ -0,0 +1,88 @@
+# Lectura y escritura de datasets en el formato de la carpeta 'datasets':
+#   - estudiantes: CSV con columnas id, name, distancia_optima
+#   - compatibilidades: CSV con columnas student1_id, student2_id (parejas que se distraen)
+# Lo usan tanto la interfaz gráfica como el modo por lotes de la línea de comandos.
+
+import csv
+import json
+import os
+
+import numpy as np
+
+from core.models import Student
+
+STUDENTS_PREFIX = 'students_'
+COMPATIBILITY_PREFIX = 'compatibility_'
+
+def load_students(path):
+    """Devuelve (students, ids): los estudiantes en orden y el id de cada uno en el archivo."""
+    students = []
+    ids = []
+    with open(path, mode='r', encoding='utf-8') as infile:
+        for row in csv.DictReader(infile):
+            students.append(Student(row['name'].strip(), float(row['distancia_optima'].strip()), len(students)))
+            ids.append(row['id'].strip())
+    return students, ids
+
+def load_conflict_pairs(path, ids):
+    """Parejas (i, j) de índices de estudiantes incompatibles; se ignoran ids desconocidos."""
+    index_of = {file_id: index for index, file_id in enumerate(ids)}
+    pairs = []
+    with open(path, mode='r', encoding='utf-8') as infile:
+        for row in csv.DictReader(infile):
+            s1_id = row['student1_id'].strip()
+            s2_id = row['student2_id'].strip()
+            if s1_id in index_of and s2_id in index_of:
+                pairs.append((index_of[s1_id], index_of[s2_id]))
+    return pairs
+
+def load_dataset(students_file, compat_file):
+    """Devuelve (students, ids, pairs) de un par de archivos estudiantes/compatibilidades."""
+    students, ids = load_students(students_file)
+    return students, ids, load_conflict_pairs(compat_file, ids)
+
+def compatibility_matrix(num_students, pairs):
+    """Matriz simétrica n x n con 1 en las parejas incompatibles."""
+    matrix = np.zeros((num_students, num_students))
+    for i, j in pairs:
+        matrix[i, j] = matrix[j, i] = 1
+    return matrix
+
+def find_datasets(directory):
+    """
+    Pares de archivos de un directorio: 'students_<nombre>.csv' con
+    'compatibility_<nombre>.csv'. Devuelve una lista ordenada de
+    (nombre, archivo_estudiantes, archivo_compatibilidades).
+    """
+    found = []
+    for filename in sorted(os.listdir(directory)):
+        if not (filename.startswith(STUDENTS_PREFIX) and filename.endswith('.csv')):
+            continue
+        name = filename[len(STUDENTS_PREFIX):-len('.csv')]
+        compat_file = os.path.join(directory, f"{COMPATIBILITY_PREFIX}{name}.csv")
+        if os.path.exists(compat_file):
+            found.append((name, os.path.join(directory, filename), compat_file))
+    return found
+
+def write_assignment(path, students, ids, seats, seat_distances, assignment):
+    """CSV con el asiento asignado a cada estudiante (fila, columna y distancia)."""
+    with open(path, mode='w', encoding='utf-8', newline='') as outfile:
+        writer = csv.writer(outfile)
+        writer.writerow(['id', 'name', 'distancia_optima', 'row', 'col', 'distance'])
+        for student, file_id, seat_idx in zip(students, ids, assignment):
+            row, col = seats[seat_idx]
+            writer.writerow([file_id, student.name, student.distancia_optima, row, col, seat_distances[seats[seat_idx]]])
+
+def _plain(value):
+    # Los registros del logbook traen escalares de NumPy que json no sabe escribir.
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+def write_json(path, data):
+    with open(path, mode='w', encoding='utf-8') as outfile:
+        json.dump(_plain(data), outfile, ensure_ascii=False, indent=2)
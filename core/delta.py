@@ -0,0 +1,105 @@
+# Evaluación incremental (delta) del fitness: a partir de las sumas parciales de un
+# cromosoma, recalcula el fitness después de mover a unos pocos estudiantes.
+
+import numpy as np
+
+class IncrementalEvaluator:
+    """
+    Mantiene las sumas parciales de las tres penalizaciones de un cromosoma para
+    recalcular el fitness a partir de una lista de cambios (estudiante, asiento_nuevo)
+    sin volver a recorrer todo el individuo. Solo se actualizan los errores de visión
+    de los estudiantes movidos, las parejas incompatibles que los involucran y los
+    asientos que quedan libres u ocupados. Usa las tablas de un ProblemInstance.
+    """
+    def __init__(self, chromosome, instance):
+        self.instance = instance
+        self.chromosome = [int(seat) for seat in chromosome[:instance.num_students]]
+        self.empty_penalty = instance.empty_penalty
+        # Copias en listas de Python: los cambios se evalúan de uno en uno y así cada
+        # consulta no paga el costo de indexar un arreglo de NumPy.
+        self._seat_rows = instance.layout.seat_rows.tolist()
+        self._seat_cols = instance.layout.seat_cols.tolist()
+        self._seat_dists = instance.layout.seat_dists.tolist()
+        self._optimas = instance.optimas.tolist()
+        self._needs = instance.needs.tolist()
+
+        self.conflict_neighbors = [[] for _ in range(instance.num_students)]
+        for i, j in zip(instance.conflict_i.tolist(), instance.conflict_j.tolist()):
+            self.conflict_neighbors[i].append(j)
+            self.conflict_neighbors[j].append(i)
+
+        seats_of = np.array(self.chromosome, dtype=np.intp)
+        self.seat_counts = np.bincount(seats_of, minlength=instance.seats_count)
+        self.vision_total = float(instance.vision(np.arange(instance.num_students), seats_of).sum())
+        self.close_pairs = int(instance.close(seats_of[instance.conflict_i], seats_of[instance.conflict_j]).sum())
+        self.empty_count = int((self.seat_counts == 0).sum())
+        self.empty_total = float(self.empty_penalty[self.seat_counts == 0].sum())
+        self.fitness = self._fitness(self.vision_total, self.close_pairs, self.empty_total, self.empty_count)
+
+    def _fitness(self, vision_total, close_pairs, empty_total, empty_count):
+        instance = self.instance
+        return float(instance.fitness_from_penalties(vision_total / instance.vision_norm,
+                                                     50.0 * close_pairs / instance.conflict_norm,
+                                                     empty_total / max(empty_count, 1)))
+
+    def _vision(self, student_idx, seat):
+        return abs(self._seat_dists[seat] - self._optimas[student_idx]) if self._needs[student_idx] else 0.0
+
+    def _close(self, seat_a, seat_b):
+        return abs(self._seat_rows[seat_a] - self._seat_rows[seat_b]) <= 1 and \
+            abs(self._seat_cols[seat_a] - self._seat_cols[seat_b]) <= 1
+
+    def _deltas(self, changes):
+        moves = {}
+        for student_idx, new_seat in changes:
+            moves[student_idx] = new_seat
+
+        # 1. Visión: solo cambian los errores de los estudiantes movidos.
+        vision_delta = sum(self._vision(i, seat) - self._vision(i, self.chromosome[i]) for i, seat in moves.items())
+
+        # 2. Compatibilidad: parejas que tocan a algún estudiante movido (cada una una sola vez).
+        touched = {(min(i, j), max(i, j)) for i in moves for j in self.conflict_neighbors[i]}
+        close_delta = sum(int(self._close(moves.get(i, self.chromosome[i]), moves.get(j, self.chromosome[j]))) -
+                          int(self._close(self.chromosome[i], self.chromosome[j])) for i, j in touched)
+
+        # 3. Asientos vacíos: ocupación de los asientos que se liberan o se ocupan.
+        count_changes = {}
+        for i, seat in moves.items():
+            old_seat = self.chromosome[i]
+            if seat != old_seat:
+                count_changes[old_seat] = count_changes.get(old_seat, 0) - 1
+                count_changes[seat] = count_changes.get(seat, 0) + 1
+        empty_total_delta = 0.0
+        empty_count_delta = 0
+        for seat, change in count_changes.items():
+            was_empty = self.seat_counts[seat] == 0
+            is_empty = self.seat_counts[seat] + change == 0
+            if was_empty != is_empty:
+                sign = 1 if is_empty else -1
+                empty_total_delta += sign * float(self.empty_penalty[seat])
+                empty_count_delta += sign
+        return moves, vision_delta, close_delta, count_changes, empty_total_delta, empty_count_delta
+
+    def evaluate_changes(self, changes):
+        """Fitness que tendría el cromosoma tras aplicar los cambios, sin modificarlo."""
+        _, vision_delta, close_delta, _, empty_total_delta, empty_count_delta = self._deltas(changes)
+        return self._fitness(self.vision_total + vision_delta, self.close_pairs + close_delta,
+                             self.empty_total + empty_total_delta, self.empty_count + empty_count_delta)
+
+    def apply_changes(self, changes):
+        """Aplica los cambios al cromosoma, actualiza las sumas parciales y devuelve el nuevo fitness."""
+        moves, vision_delta, close_delta, count_changes, empty_total_delta, empty_count_delta = self._deltas(changes)
+        for i, seat in moves.items():
+            self.chromosome[i] = seat
+        for seat, change in count_changes.items():
+            self.seat_counts[seat] += change
+        self.vision_total += vision_delta
+        self.close_pairs += close_delta
+        self.empty_total += empty_total_delta
+        self.empty_count += empty_count_delta
+        self.fitness = self._fitness(self.vision_total, self.close_pairs, self.empty_total, self.empty_count)
+        return self.fitness
+
+def swap_changes(chromosome, student_a, student_b):
+    """Cambios equivalentes a intercambiar los asientos de dos estudiantes."""
+    return [(student_a, chromosome[student_b]), (student_b, chromosome[student_a])]
@@ -1,7 +1,16 @@
 import random
+import time
 import numpy as np
-import math
-import copy
+
+from core.cache import FitnessCache, chromosome_key
+from core.checkpoint import load_checkpoint, save_checkpoint
+from core.hall_of_fame import HallOfFame
+from core.instance import ProblemInstance, build_conflict_edges
+from core.local_search import refine_population, refine_hall_of_fame
+from core.models import GAResult, GenerationEvent
+from core.population import Population
+from core.profiling import NULL_PROFILER, make_profiler
+from core.seeding import roster_mapping, seed_population, unaffected_students, warm_start_assignment
 
 # ESTRUCTURA DEL INDIVIDUO
 class Individual:
@@ -24,21 +33,19 @@ def penalizacion_vision(individual_chromosome, students, seats, seat_distances):
             students_with_needs += 1
     return total_error / max(students_with_needs, 1)
 
-def penalizacion_compatibilidad(individual_chromosome, students, seats, compatibility_matrix):
+def penalizacion_compatibilidad(individual_chromosome, students, seats, compatibility_matrix, conflict_edges=None):
+    if conflict_edges is None:
+        conflict_edges = build_conflict_edges(compatibility_matrix)
+    pairs_i, pairs_j = conflict_edges
     total_penalty = 0
-    incompatible_pairs_count = 0 
-    n = len(individual_chromosome)
-    for i in range(n):
-        for j in range(i + 1, n):
-            if compatibility_matrix[i][j] == 1:
-                incompatible_pairs_count += 1
-                seat_i_coords = seats[individual_chromosome[i]]
-                seat_j_coords = seats[individual_chromosome[j]]
-                row_diff = abs(seat_i_coords[0] - seat_j_coords[0])
-                col_diff = abs(seat_i_coords[1] - seat_j_coords[1])
-                if row_diff <= 1 and col_diff <= 1:
-                    total_penalty += 50.0
-    return total_penalty / max(incompatible_pairs_count, 1)
+    for i, j in zip(pairs_i, pairs_j):
+        seat_i_coords = seats[individual_chromosome[i]]
+        seat_j_coords = seats[individual_chromosome[j]]
+        row_diff = abs(seat_i_coords[0] - seat_j_coords[0])
+        col_diff = abs(seat_i_coords[1] - seat_j_coords[1])
+        if row_diff <= 1 and col_diff <= 1:
+            total_penalty += 50.0
+    return total_penalty / max(len(pairs_i), 1)
 
 def penalizacion_asientos_vacios(individual_chromosome, all_seats, seat_distances, d_max):
     occupied_seats_indices = set(individual_chromosome)
@@ -59,7 +66,8 @@ def evaluate(individual, students, seats, compatibility_matrix, seat_distances,
     """
     # 1. Calcular las tres penalizaciones (errores)
     v_penalty = penalizacion_vision(individual.chromosome, students, seats, seat_distances)
-    c_penalty = penalizacion_compatibilidad(individual.chromosome, students, seats, compatibility_matrix)
+    c_penalty = penalizacion_compatibilidad(individual.chromosome, students, seats, compatibility_matrix,
+                                            conflict_edges=kwargs.get('conflict_edges'))
     e_penalty = penalizacion_asientos_vacios(individual.chromosome, seats, seat_distances, d_max)
 
     # 2. Normalizar cada penalización para que estén en una escala comparable.
@@ -76,14 +84,28 @@ def evaluate(individual, students, seats, compatibility_matrix, seat_distances,
     
     # 4. Calcular el fitness final.
     fitness = 1 / (term1 * term2 * term3)
-    
+
     return fitness
 
+def evaluate_population(pop_matrix, students, seats, compatibility_matrix, seat_distances, d_max, **kwargs):
+    """
+    Versión vectorizada de evaluate(): recibe toda la generación como una matriz
+    entera (individuos x estudiantes) y devuelve un arreglo con el fitness de cada fila.
+    Las tres penalizaciones se calculan con NumPy en una sola pasada y dan los mismos
+    valores que evaluate() aplicado individuo por individuo.
+    Si se pasa `instance` (ProblemInstance) se usan sus tablas ya compiladas.
+    """
+    instance = kwargs.get('instance')
+    if instance is None:
+        instance = ProblemInstance(students, seats, compatibility_matrix, seat_distances, d_max=d_max,
+                                   conflict_edges=kwargs.get('conflict_edges'))
+    return instance.evaluate_population(pop_matrix)
+
 # REPARACIÓN
 def feasible(individual_chromosome):
     return len(set(individual_chromosome)) == len(individual_chromosome)
 
-def repair(individual_chromosome, seats_count):
+def repair(individual_chromosome, seats_count, rng=random):
     if feasible(individual_chromosome):
         return individual_chromosome
     used_seats = set()
@@ -94,26 +116,26 @@ def repair(individual_chromosome, seats_count):
         else:
             used_seats.add(seat)
     available_seats = [s for s in range(seats_count) if s not in used_seats]
-    random.shuffle(available_seats)
+    rng.shuffle(available_seats)
     for i in duplicates_indices:
         if available_seats:
             individual_chromosome[i] = available_seats.pop()
     return individual_chromosome
 
 # OPERADORES GENÉTICOS 
-def selection_tournament(population, k, tournsize):
+def selection_tournament(population, k, tournsize, rng=random):
     selected = []
     for _ in range(k):
-        aspirants = random.sample(population, tournsize)
+        aspirants = rng.sample(population, tournsize)
         winner = max(aspirants, key=lambda ind: ind.fitness)
         selected.append(winner)
     return selected
 
-def crossover_uniform(ind1, ind2, indpb):
+def crossover_uniform(ind1, ind2, indpb, rng=random):
     child1_chromo = []
     child2_chromo = []
     for i in range(len(ind1.chromosome)):
-        if random.random() < indpb:
+        if rng.random() < indpb:
             child1_chromo.append(ind2.chromosome[i])
             child2_chromo.append(ind1.chromosome[i])
         else:
@@ -121,75 +143,615 @@ def crossover_uniform(ind1, ind2, indpb):
             child2_chromo.append(ind2.chromosome[i])
     return Individual(child1_chromo), Individual(child2_chromo)
 
-def mutate_integer(individual, low, up, indpb):
+def mutate_integer(individual, low, up, indpb, rng=random):
     for i in range(len(individual.chromosome)):
-        if random.random() < indpb:
-            individual.chromosome[i] = random.randint(low, up)
+        if rng.random() < indpb:
+            individual.chromosome[i] = rng.randint(low, up)
+
+# OPERADORES VECTORIZADOS (TODA LA POBLACIÓN A LA VEZ)
+# Trabajan sobre la matriz de genes (individuos x genes) con un único np.random.Generator.
+def selection_tournament_batch(fitness, k, tournsize, rng):
+    """Torneos de `tournsize` aspirantes sacados de una sola matriz de índices; devuelve los índices ganadores."""
+    aspirants = rng.integers(0, len(fitness), size=(k, tournsize))
+    winners = np.argmax(fitness[aspirants], axis=1)
+    return aspirants[np.arange(k), winners]
+
+def crossover_uniform_batch(genes, cxpb, indpb, rng):
+    """Cruce uniforme en el sitio de las parejas (0, 1), (2, 3), ... con una máscara booleana por bloque."""
+    n_pairs = len(genes) // 2
+    first = genes[0:2 * n_pairs:2]
+    second = genes[1:2 * n_pairs:2]
+    mate = rng.random(n_pairs) < cxpb
+    mask = (rng.random(first.shape) < indpb) & mate[:, np.newaxis]
+    swapped = np.where(mask, second, first)
+    second[...] = np.where(mask, first, second)
+    first[...] = swapped
+
+def mutate_integer_batch(genes, low, up, mutpb, indpb, rng):
+    """Mutación entera en el sitio: una máscara elige individuos (mutpb) y genes (indpb) de toda la población."""
+    mutants = rng.random(len(genes)) < mutpb
+    mask = (rng.random(genes.shape) < indpb) & mutants[:, np.newaxis]
+    genes[mask] = rng.integers(low, up + 1, size=int(mask.sum()))
+
+def repair_batch(genes, seats_count, rng):
+    """
+    Igual que repair() pero sobre toda la matriz y sin bucles por fila: en cada fila se
+    conserva la primera aparición de cada asiento y las repeticiones se reemplazan por
+    asientos libres de esa fila tomados en orden aleatorio.
+    Devuelve (filas reparadas, genes repetidos reemplazados).
+    """
+    order = np.argsort(genes, axis=1, kind='stable')
+    sorted_genes = np.take_along_axis(genes, order, axis=1)
+    repeated = sorted_genes[:, 1:] == sorted_genes[:, :-1]
+    infeasible = np.flatnonzero(repeated.any(axis=1))
+    if len(infeasible) == 0:
+        return 0, 0
+
+    # Posiciones repetidas (el orden estable deja la primera aparición como original).
+    duplicates = np.zeros((len(infeasible), genes.shape[1]), dtype=bool)
+    rows, cols = np.nonzero(repeated[infeasible])
+    duplicates[rows, order[infeasible][rows, cols + 1]] = True
+
+    # Asientos libres de cada fila, barajados: claves aleatorias y los ocupados al final.
+    sub = genes[infeasible]
+    occupied = np.zeros((len(infeasible), seats_count), dtype=bool)
+    occupied[np.arange(len(infeasible))[:, np.newaxis], sub] = True
+    keys = rng.random((len(infeasible), seats_count))
+    keys[occupied] = 2.0
+    free_seats = np.argsort(keys, axis=1)
+    free_count = seats_count - occupied.sum(axis=1)
+
+    # La k-ésima repetición de una fila recibe su k-ésimo asiento libre (si queda alguno).
+    rank = np.cumsum(duplicates, axis=1) - 1
+    fixable = duplicates & (rank < free_count[:, np.newaxis])
+    dup_rows, dup_cols = np.nonzero(fixable)
+    sub[dup_rows, dup_cols] = free_seats[dup_rows, rank[dup_rows, dup_cols]]
+    genes[infeasible] = sub
+    return len(infeasible), len(dup_rows)
+
+# OPERADORES PARA LA CODIFICACIÓN POR PERMUTACIÓN
+# El cromosoma es una permutación de todos los índices de asiento: las primeras
+# n posiciones son los asientos de los n estudiantes y el resto quedan vacíos.
+# Estos operadores conservan la permutación, así que nunca hace falta repair().
+def random_permutation(seats_count, rng=random):
+    chromosome = list(range(seats_count))
+    rng.shuffle(chromosome)
+    return chromosome
+
+def crossover_ox(ind1, ind2, rng=random):
+    """Order crossover (OX): copia un segmento de un padre y completa con el orden del otro."""
+    size = len(ind1.chromosome)
+    a, b = sorted(rng.sample(range(size + 1), 2))
+
+    def make_child(p1, p2):
+        child = [None] * size
+        child[a:b] = p1[a:b]
+        segment = set(p1[a:b])
+        fill = [gene for gene in p2[b:] + p2[:b] if gene not in segment]
+        for k, pos in enumerate(list(range(b, size)) + list(range(0, a))):
+            child[pos] = fill[k]
+        return child
+
+    return (Individual(make_child(ind1.chromosome, ind2.chromosome)),
+            Individual(make_child(ind2.chromosome, ind1.chromosome)))
+
+def crossover_pmx(ind1, ind2, rng=random):
+    """Partially mapped crossover (PMX): intercambia un segmento y resuelve los choques con el mapeo."""
+    size = len(ind1.chromosome)
+    a, b = sorted(rng.sample(range(size + 1), 2))
+
+    def make_child(p1, p2):
+        child = list(p2)
+        child[a:b] = p1[a:b]
+        mapping = {p1[k]: p2[k] for k in range(a, b)}
+        for pos in list(range(0, a)) + list(range(b, size)):
+            gene = p2[pos]
+            while gene in mapping:
+                gene = mapping[gene]
+            child[pos] = gene
+        return child
+
+    return (Individual(make_child(ind1.chromosome, ind2.chromosome)),
+            Individual(make_child(ind2.chromosome, ind1.chromosome)))
+
+def mutate_swap(individual, indpb, rng=random):
+    chromosome = individual.chromosome
+    size = len(chromosome)
+    if size < 2:
+        return
+    for i in range(size):
+        if rng.random() < indpb:
+            j = rng.randrange(size - 1)
+            if j >= i:
+                j += 1
+            chromosome[i], chromosome[j] = chromosome[j], chromosome[i]
+
+def mutate_insert(individual, indpb=None, rng=random):
+    chromosome = individual.chromosome
+    if len(chromosome) < 2:
+        return
+    i, j = rng.sample(range(len(chromosome)), 2)
+    chromosome.insert(j, chromosome.pop(i))
+
+def mutate_scramble(individual, indpb=None, rng=random):
+    chromosome = individual.chromosome
+    a, b = sorted(rng.sample(range(len(chromosome) + 1), 2))
+    segment = chromosome[a:b]
+    rng.shuffle(segment)
+    chromosome[a:b] = segment
+
+PERMUTATION_CROSSOVERS = {'ox': crossover_ox, 'pmx': crossover_pmx}
+PERMUTATION_MUTATIONS = {'swap': mutate_swap, 'insert': mutate_insert, 'scramble': mutate_scramble}
+
+def _resolve_operators(encoding, crossover=None, mutation=None):
+    """
+    Valida la codificación y sus operadores y devuelve (crossover, mutation). En
+    permutación, None elige 'ox' y 'swap'; la codificación entera tiene sus propios
+    operadores (cruce uniforme y mutación entera) y no acepta otros.
+    """
+    if encoding == 'permutation':
+        crossover = 'ox' if crossover is None else crossover
+        mutation = 'swap' if mutation is None else mutation
+        if crossover not in PERMUTATION_CROSSOVERS:
+            raise ValueError(f"Cruce desconocido: {crossover} (opciones: {', '.join(PERMUTATION_CROSSOVERS)})")
+        if mutation not in PERMUTATION_MUTATIONS:
+            raise ValueError(f"Mutación desconocida: {mutation} (opciones: {', '.join(PERMUTATION_MUTATIONS)})")
+    elif encoding == 'integer':
+        if crossover is not None or mutation is not None:
+            raise ValueError("La codificación entera no acepta `crossover` ni `mutation`; "
+                             "son para encoding='permutation'")
+    else:
+        raise ValueError(f"Codificación desconocida: {encoding}")
+    return crossover, mutation
 
 # FUNCIÓN PRINCIPAL DEL ALGORITMO GENÉTICO (run_ga) 
-def run_ga(students, seats, compatibility_matrix, seat_distances, front_rows,
-           ngen=150, pop_size=200, cxpb=0.8, mutpb=0.2, **kwargs): 
-    
-    num_students = len(students)
-    seats_count = len(seats)
-    d_max = max(seat_distances.values()) if seat_distances else 1
+def _assign_fitness(population, instance, cache=None):
+    # Evalúa toda la generación de una vez y escribe el resultado en population.fitness.
+    # Con caché, solo se evalúan (una vez) los cromosomas que no se han visto antes.
+    # Devuelve cuántos cromosomas se evaluaron realmente.
+    genes = population.genes[:, :instance.num_students]
+    if cache is None:
+        population.fitness[:] = instance.evaluate_population(genes)
+        return len(genes)
+
+    pending = {}
+    for i, row in enumerate(genes):
+        key = chromosome_key(row)
+        if key in pending:
+            # Repetido dentro de la misma generación: también se ahorra su evaluación.
+            pending[key].append(i)
+            cache.hits += 1
+            continue
+        fitness = cache.get(key)
+        if fitness is not None:
+            population.fitness[i] = fitness
+        else:
+            pending[key] = [i]
+    if not pending:
+        return 0
 
-    population = []
-    for _ in range(pop_size):
-        chromosome = [random.randint(0, seats_count - 1) for _ in range(num_students)]
-        population.append(Individual(chromosome))
+    rows = [group[0] for group in pending.values()]
+    fitness_values = instance.evaluate_population(genes[rows])
+    for (key, group), fitness in zip(pending.items(), fitness_values):
+        cache.put(key, float(fitness))
+        population.fitness[group] = fitness
+    return len(rows)
 
-    print("=== INICIANDO ALGORITMO GENÉTICO (IMPLEMENTACIÓN MANUAL) ===")
-    for ind in population:
-        repair(ind.chromosome, seats_count)
-        ind.fitness = evaluate(ind, students, seats, compatibility_matrix, seat_distances, d_max)
+def _make_rngs(seed):
+    # Generador NumPy para los operadores vectorizados y un random.Random derivado de él
+    # para los operadores de permutación, que trabajan fila por fila.
+    rng = np.random.default_rng(seed)
+    return rng, random.Random(int(rng.integers(2**63)))
 
-    logbook = []
-    hof = sorted(population, key=lambda ind: ind.fitness, reverse=True)[:3]
+def _init_population(pop_size, num_students, seats_count, permutation, rng, seeds=None):
+    if permutation:
+        genes = rng.permuted(np.tile(np.arange(seats_count), (pop_size, 1)), axis=1)
+    else:
+        genes = rng.integers(0, seats_count, size=(pop_size, num_students))
+        repair_batch(genes, seats_count, rng)
+    if seeds is not None:
+        genes[:len(seeds)] = seeds
+    return Population.from_chromosomes(genes)
 
-    for gen in range(1, ngen + 1):
-        parents = selection_tournament(population, k=len(population), tournsize=3)
-        offspring = [copy.deepcopy(p) for p in parents]
+def _make_offspring(population, seats_count, cxpb, mutpb, permutation, crossover, mutation, rng, py_rng,
+                    profiler=NULL_PROFILER):
+    # Selección, clonación (copia de filas al búfer de reserva), cruce, mutación y,
+    # solo en codificación entera, reparación. Al final el búfer pasa a ser la población.
+    profiler.begin()
+    parents = selection_tournament_batch(population.fitness, len(population), 3, rng)
+    profiler.lap('selection')
+    population.clone_into_next(parents)
+    offspring = population.next_genes
+    profiler.lap('clone')
 
+    if permutation:
         for i in range(0, len(offspring) - 1, 2):
-            if random.random() < cxpb:
-                child1, child2 = crossover_uniform(offspring[i], offspring[i+1], indpb=0.5)
-                offspring[i] = child1
-                offspring[i+1] = child2
-
-        for ind in offspring:
-            if random.random() < mutpb:
-                mutate_integer(ind, low=0, up=seats_count - 1, indpb=0.05)
-        
-        for ind in offspring:
-            repair(ind.chromosome, seats_count)
-            ind.fitness = evaluate(ind, students, seats, compatibility_matrix, seat_distances, d_max)
-        
-        population[:] = offspring
-
-        hof.extend(population)
-        hof = sorted(hof, key=lambda ind: ind.fitness, reverse=True)
-        unique_hof_chromosomes = []
-        new_hof = []
-        for ind in hof:
-            if ind.chromosome not in unique_hof_chromosomes:
-                unique_hof_chromosomes.append(ind.chromosome)
-                new_hof.append(ind)
-        hof = new_hof[:3]
-
-        fitness_values = [ind.fitness for ind in population]
-        stats_record = {
-            'gen': gen,
-            'avg': np.mean(fitness_values),
-            'max': np.max(fitness_values),
-            'min': np.min(fitness_values),
-        }
-        logbook.append(stats_record)
-        
-        print(f"gen {gen:<4} avg {stats_record['avg']:.6f} max {stats_record['max']:.6f} min {stats_record['min']:.6f}")
-
-    print("=== ALGORITMO COMPLETADO ===")
-    
-    top_solutions = [ind.chromosome for ind in hof]
-            
-    return top_solutions, logbook
+            if py_rng.random() < cxpb:
+                child1, child2 = PERMUTATION_CROSSOVERS[crossover](Individual(offspring[i].tolist()),
+                                                                   Individual(offspring[i+1].tolist()), rng=py_rng)
+                offspring[i] = child1.chromosome
+                offspring[i+1] = child2.chromosome
+        profiler.lap('crossover')
+        for row in offspring:
+            if py_rng.random() < mutpb:
+                ind = Individual(row.tolist())
+                PERMUTATION_MUTATIONS[mutation](ind, indpb=0.05, rng=py_rng)
+                row[:] = ind.chromosome
+        profiler.lap('mutation')
+    else:
+        crossover_uniform_batch(offspring, cxpb, 0.5, rng)
+        profiler.lap('crossover')
+        mutate_integer_batch(offspring, 0, seats_count - 1, mutpb, 0.05, rng)
+        profiler.lap('mutation')
+        repaired, fixed = repair_batch(offspring, seats_count, rng)
+        profiler.lap('repair')
+        profiler.count('repairs', repaired)
+        profiler.count('duplicates_fixed', fixed)
+
+    population.swap()
+
+def _apply_pins(genes, pin_students, pin_seats, seats_count):
+    # Devuelve a cada estudiante fijo a su asiento sin romper la factibilidad: las
+    # posiciones libres que tenían un asiento de los fijos reciben asientos que los
+    # fijos dejaron. Como cada fila no repite asientos, alcanzan (en permutación son
+    # justo los necesarios; en codificación entera los que sobran quedan vacíos).
+    if len(pin_students) == 0:
+        return
+    is_pin_seat = np.zeros(seats_count, dtype=bool)
+    is_pin_seat[pin_seats] = True
+    free_positions = np.ones(genes.shape[1], dtype=bool)
+    free_positions[pin_students] = False
+    for r in np.flatnonzero((genes[:, pin_students] != pin_seats).any(axis=1)):
+        row = genes[r]
+        holders = free_positions & is_pin_seat[row]
+        displaced = row[pin_students]
+        row[pin_students] = pin_seats
+        row[holders] = displaced[~is_pin_seat[displaced]][:np.count_nonzero(holders)]
+
+def _stats_record(gen, fitness_values, cache=None, cache_counters=(0, 0)):
+    stats_record = {
+        'gen': gen,
+        'avg': np.mean(fitness_values),
+        'max': np.max(fitness_values),
+        'min': np.min(fitness_values),
+    }
+    if cache is not None:
+        # Aciertos y fallos de la caché durante esta generación.
+        hits, misses = cache.counters()
+        stats_record['cache_hits'] = hits - cache_counters[0]
+        stats_record['cache_misses'] = misses - cache_counters[1]
+    return stats_record
+
+def _print_record(stats_record):
+    print(f"gen {stats_record['gen']:<4} avg {stats_record['avg']:.6f} max {stats_record['max']:.6f} min {stats_record['min']:.6f}")
+
+def _stop_reason(gen, ngen, elapsed, gen_time, best_fitness, stall, evaluations, pop_size,
+                 time_budget, target_fitness, stall_generations, max_evaluations):
+    # Criterios de parada, en orden de prioridad. None significa "seguir".
+    if target_fitness is not None and best_fitness >= target_fitness:
+        return 'target_fitness'
+    # El presupuesto de tiempo se respeta antes de empezar una generación que no cabría.
+    if time_budget is not None and elapsed + gen_time > time_budget:
+        return 'time_budget'
+    # Igual con las evaluaciones: una generación evalúa a lo más `pop_size` individuos.
+    if max_evaluations is not None and evaluations + pop_size > max_evaluations:
+        return 'max_evaluations'
+    if stall_generations is not None and stall >= stall_generations:
+        return 'stall'
+    if ngen is not None and gen >= ngen:
+        return 'max_generations'
+    return None
+
+def iter_ga(students, seats, compatibility_matrix, seat_distances, front_rows,
+            ngen=150, pop_size=200, cxpb=0.8, mutpb=0.2, encoding='integer',
+            crossover=None, mutation=None, seed=None, cache_size=10000, hof_size=3,
+            time_budget=None, target_fitness=None, stall_generations=None, max_evaluations=None,
+            local_search=None, ls_top_k=2, ls_strategy='best', ls_max_steps=20,
+            seeding=None, seed_fraction=0.2, initial_assignment=None, profile=False, profile_path=None,
+            checkpoint_path=None, checkpoint_interval=10, resume_from=None, should_stop=None, instance=None,
+            pinned=None, **kwargs):
+    """
+    Versión en flujo de solve() con los mismos parámetros: produce un GenerationEvent
+    por generación, en cuanto termina, y al agotarse devuelve el GAResult como valor
+    de StopIteration. No imprime ni da formato a nada; el logbook del resultado es la
+    secuencia de `event.stats`. `resume_from` es un punto de control ya leído con
+    core.checkpoint.load_checkpoint() (ver resume_ga()).
+    """
+    crossover, mutation = _resolve_operators(encoding, crossover, mutation)
+    if local_search not in (None, 'generation', 'final'):
+        raise ValueError(f"Modo de búsqueda local desconocido: {local_search}")
+    if seeding not in (None, 'assignment'):
+        raise ValueError(f"Modo de siembra desconocido: {seeding}")
+    if checkpoint_interval < 1:
+        raise ValueError("checkpoint_interval debe ser al menos 1")
+    if ngen is None and time_budget is None and max_evaluations is None and stall_generations is None:
+        raise ValueError("Sin ngen hace falta otro criterio de parada (time_budget, max_evaluations o stall_generations)")
+    permutation = encoding == 'permutation'
+    rng, py_rng = _make_rngs(seed)
+    start_time = time.perf_counter()
+    profiler = make_profiler(profile, profile_path)
+    # El perfilador se cierra (cProfile se desactiva y vuelca) también si la ejecución
+    # termina con una excepción o si el consumidor cierra el generador antes de tiempo.
+    try:
+        # Parámetros que se guardan en los puntos de control para poder reanudar.
+        settings = dict(ngen=ngen, pop_size=pop_size, cxpb=cxpb, mutpb=mutpb, encoding=encoding,
+                        crossover=crossover, mutation=mutation, cache_size=cache_size, hof_size=hof_size,
+                        time_budget=time_budget, target_fitness=target_fitness,
+                        stall_generations=stall_generations, max_evaluations=max_evaluations,
+                        local_search=local_search, ls_top_k=ls_top_k, ls_strategy=ls_strategy,
+                        ls_max_steps=ls_max_steps, seeding=seeding, seed_fraction=seed_fraction,
+                        profile=profile, checkpoint_interval=checkpoint_interval,
+                        pinned=None if pinned is None else np.asarray(pinned, dtype=np.intp).tolist())
+
+        if instance is None:
+            instance = ProblemInstance(students, seats, compatibility_matrix, seat_distances,
+                                       conflict_edges=kwargs.get('conflict_edges'))
+        num_students = instance.num_students
+        seats_count = instance.seats_count
+        # Estudiantes fijos: pares (estudiante, asiento) que ningún operador cambia.
+        pins = np.asarray(pinned if pinned is not None else [], dtype=np.intp).reshape(-1, 2)
+        pin_students, pin_seats = pins[:, 0], pins[:, 1]
+        if len(np.unique(pin_students)) < len(pins) or len(np.unique(pin_seats)) < len(pins):
+            raise ValueError("Los estudiantes fijos deben tener asientos distintos")
+        fixed = None
+        if len(pins):
+            fixed = np.zeros(num_students, dtype=bool)
+            fixed[pin_students] = True
+
+        if resume_from is None:
+            cache = FitnessCache(cache_size) if cache_size else None
+            seeds = None
+            if seeding == 'assignment' or initial_assignment is not None:
+                seed_count = min(pop_size, max(1, int(round(seed_fraction * pop_size))))
+                seeds = seed_population(instance, seed_count, rng, permutation, base=initial_assignment,
+                                        movable=None if fixed is None else np.flatnonzero(~fixed))
+            init_start = time.perf_counter()
+            population = _init_population(pop_size, num_students, seats_count, permutation, rng, seeds)
+            _apply_pins(population.genes, pin_students, pin_seats, seats_count)
+            evaluations = _assign_fitness(population, instance, cache=cache)
+            # Crear y evaluar la población inicial es el mismo trabajo que una generación:
+            # sirve de estimación para que time_budget también se respete en la primera.
+            gen_time = time.perf_counter() - init_start
+
+            logbook = []
+            hof = HallOfFame(hof_size)
+            hof.update(population, num_students)
+            best_fitness = float(np.max(population.fitness))
+            stall = 0
+            gen = 0
+            elapsed = time.perf_counter() - start_time
+        else:
+            # REANUDACIÓN: se restaura el estado exacto del final de la generación guardada.
+            expected = (pop_size, seats_count if permutation else num_students)
+            if resume_from['genes'].shape != expected:
+                raise ValueError(f"El punto de control tiene una población de {resume_from['genes'].shape} "
+                                 f"y esta ejecución espera {expected}")
+            population = Population.from_chromosomes(resume_from['genes'])
+            population.fitness[:] = resume_from['fitness']
+            rng.bit_generator.state = resume_from['rng_state']
+            py_rng.setstate(resume_from['py_rng_state'])
+            cache = resume_from['cache']
+            hof = resume_from['hof']
+            logbook = list(resume_from['logbook'])
+            counters = resume_from['counters']
+            gen = counters['gen']
+            evaluations = counters['evaluations']
+            best_fitness = counters['best_fitness']
+            stall = counters['stall']
+            gen_time = counters['gen_time']
+            elapsed = counters['elapsed']
+            # El tiempo ya consumido cuenta para time_budget y para `elapsed`.
+            start_time -= elapsed
+        saved_gen = gen
+        # La búsqueda local (por generación o final) se corta al agotarse el presupuesto de tiempo.
+        deadline = start_time + time_budget if time_budget is not None else None
+
+        def write_checkpoint():
+            save_checkpoint(checkpoint_path, settings, population, rng, py_rng, hof, cache, logbook,
+                            dict(gen=gen, evaluations=evaluations, best_fitness=best_fitness, stall=stall,
+                                 gen_time=gen_time, elapsed=elapsed), num_students)
+
+        while True:
+            stop_reason = _stop_reason(gen, ngen, elapsed, gen_time, best_fitness, stall, evaluations, pop_size,
+                                       time_budget, target_fitness, stall_generations, max_evaluations)
+            if stop_reason is None and should_stop is not None and should_stop():
+                stop_reason = 'cancelled'
+            if stop_reason is not None:
+                break
+            gen += 1
+            gen_start = time.perf_counter()
+
+            cache_counters = cache.counters() if cache is not None else (0, 0)
+            _make_offspring(population, seats_count, cxpb, mutpb, permutation, crossover, mutation, rng, py_rng,
+                            profiler)
+            if fixed is not None:
+                _apply_pins(population.genes, pin_students, pin_seats, seats_count)
+                profiler.lap('repair')
+            evaluated = _assign_fitness(population, instance, cache=cache)
+            evaluations += evaluated
+            profiler.lap('evaluation')
+            profiler.count('evaluations', evaluated)
+            if local_search == 'generation':
+                ls_improved = refine_population(population, instance, ls_top_k, ls_strategy, ls_max_steps, permutation,
+                                                rng, fixed, deadline, should_stop)
+                profiler.lap('local_search')
+            hof.update(population, num_students)
+            profiler.lap('hall_of_fame')
+
+            stats_record = _stats_record(gen, population.fitness, cache, cache_counters)
+            if local_search == 'generation':
+                stats_record['ls_improved'] = ls_improved
+            stats_record.update(profiler.record())
+            best_fitness_so_far, best_solution = hof.best()
+            event = GenerationEvent(gen=gen, stats=stats_record, best_fitness=best_fitness_so_far,
+                                    best_solution=best_solution, evaluations=evaluations,
+                                    elapsed=time.perf_counter() - start_time)
+            logbook.append(event.stats)
+            profiler.pause()
+            yield event
+            profiler.resume()
+
+            if stats_record['max'] > best_fitness:
+                best_fitness = float(stats_record['max'])
+                stall = 0
+            else:
+                stall += 1
+            now = time.perf_counter()
+            elapsed = now - start_time
+            # Estimación conservadora del costo de la siguiente generación.
+            gen_time = max(gen_time, now - gen_start) if gen == 1 else 0.5 * gen_time + 0.5 * (now - gen_start)
+
+            if checkpoint_path is not None and gen % checkpoint_interval == 0:
+                write_checkpoint()
+                saved_gen = gen
+
+        # El último estado también se guarda, para poder extender la ejecución (p. ej. con más ngen).
+        if checkpoint_path is not None and gen != saved_gen:
+            write_checkpoint()
+
+        if local_search == 'final':
+            # También respeta el presupuesto de tiempo y la cancelación.
+            hof = refine_hall_of_fame(hof, instance, ls_strategy, ls_max_steps, rng, deadline, should_stop, fixed)
+
+        items = hof.items()
+        return GAResult(
+            solutions=[assignment for _, assignment in items],
+            fitness=[fitness for fitness, _ in items],
+            logbook=logbook,
+            stop_reason=stop_reason,
+            generations=gen,
+            evaluations=evaluations,
+            elapsed=time.perf_counter() - start_time,
+        )
+    finally:
+        profiler.finish()
+
+def solve(students, seats, compatibility_matrix, seat_distances, front_rows,
+          verbose=True, on_generation=None, **kwargs):
+    """
+    Versión "anytime" del algoritmo genético. Además del máximo de generaciones `ngen`
+    (None = sin límite), la ejecución se detiene con el primero de estos criterios:
+      - time_budget: segundos de reloj; no se inicia una generación que no alcance a terminar.
+      - target_fitness: el mejor fitness alcanza este valor.
+      - stall_generations: ese número de generaciones seguidas sin mejorar el mejor fitness.
+      - max_evaluations: evaluaciones de fitness realizadas (sin contar aciertos de caché);
+        no se inicia una generación que pudiera superarlo.
+      - should_stop: función sin argumentos que se consulta antes de cada generación;
+        si devuelve True la ejecución se cancela (stop_reason 'cancelled'). Sirve para
+        cancelar desde otro hilo, p. ej. con threading.Event().is_set.
+    Devuelve un GAResult con las mejores soluciones encontradas hasta ese momento,
+    el logbook y el motivo de parada.
+
+    encoding='integer' usa vectores de asientos con cruce uniforme, mutación entera y repair().
+    encoding='permutation' usa permutaciones de asientos con los operadores `crossover`
+    ('ox' o 'pmx', por defecto 'ox') y `mutation` ('swap', 'insert' o 'scramble', por
+    defecto 'swap'); todos los hijos son factibles por construcción. Un operador
+    desconocido, o uno de permutación con la codificación entera, es un ValueError.
+    Con la misma `seed` la ejecución es reproducible (un np.random.Generator por ejecución).
+    `cache_size` acota la caché LRU de fitness (0 la desactiva); sus aciertos y fallos
+    por generación quedan en el logbook como 'cache_hits' y 'cache_misses'.
+    `instance` permite reutilizar un ProblemInstance ya compilado para estos datos; con
+    `conflict_edges` (o con un `instance` que ya las tenga) la matriz de compatibilidad
+    puede ser None, lo que evita la tabla n x n en aulas de miles de asientos.
+
+    Etapa memética opcional (core.local_search.hill_climb con evaluación incremental):
+    local_search='generation' refina cada generación a los `ls_top_k` mejores y registra
+    'ls_improved' en el logbook; local_search='final' refina solo el hall-of-fame final.
+    `ls_strategy` ('first' o 'best') y `ls_max_steps` acotan cada búsqueda.
+
+    Progreso: `on_generation(event)` se llama con cada GenerationEvent (estadísticas,
+    mejor solución hasta el momento, evaluaciones y tiempo). Con verbose=False no se
+    imprime ni se da formato a ninguna línea por generación. Para consumir los eventos
+    como generador, ver iter_ga().
+
+    seeding='assignment' resuelve de forma exacta el problema de asignación lineal de
+    los términos de visión y asientos vacíos (core.seeding) y llena una fracción
+    `seed_fraction` de la población inicial con esa solución y copias perturbadas.
+    Con `initial_assignment` (una asignación estudiante -> asiento) se siembra igual
+    pero alrededor de esa asignación; ver reoptimize(). `pinned` es una lista de pares
+    (estudiante, asiento) que quedan fijos: ningún operador ni la búsqueda local los mueve.
+
+    Perfilado opcional (core.profiling): con profile=True cada registro del logbook
+    incluye el tiempo de reloj de cada fase ('time_selection', 'time_clone',
+    'time_crossover', 'time_mutation', 'time_repair', 'time_evaluation',
+    'time_local_search', 'time_hall_of_fame') y los contadores 'evaluations', 'repairs'
+    y 'duplicates_fixed'. Con `profile_path` además se guarda un volcado de cProfile
+    de la ejecución en ese archivo (se lee con pstats).
+
+    Puntos de control (core.checkpoint): con `checkpoint_path` se guarda el estado
+    completo de la ejecución en ese .npz cada `checkpoint_interval` generaciones y al
+    terminar. resume_ga() la continúa desde ahí con resultados idénticos a los de una
+    ejecución sin interrumpir.
+    """
+    events = iter_ga(students, seats, compatibility_matrix, seat_distances, front_rows, **kwargs)
+    if verbose:
+        print("=== INICIANDO ALGORITMO GENÉTICO (IMPLEMENTACIÓN MANUAL) ===")
+    while True:
+        try:
+            event = next(events)
+        except StopIteration as finished:
+            result = finished.value
+            break
+        if on_generation is not None:
+            on_generation(event)
+        if verbose:
+            _print_record(event.stats)
+    if verbose:
+        print(f"=== ALGORITMO COMPLETADO ({result.stop_reason}) ===")
+    return result
+
+def resume_ga(checkpoint_path, students, seats, compatibility_matrix, seat_distances, front_rows,
+              verbose=True, on_generation=None, **kwargs):
+    """
+    Continúa una ejecución desde el punto de control `checkpoint_path` y devuelve su
+    GAResult (el logbook incluye las generaciones anteriores). Los datos del problema
+    deben ser los mismos de la ejecución original; los parámetros se toman del punto de
+    control y `kwargs` los reemplaza, típicamente para cambiar los criterios de parada
+    (p. ej. más `ngen`). Sigue guardando en el mismo archivo salvo otro `checkpoint_path`
+    en `kwargs` (o None para no guardar).
+    """
+    state = load_checkpoint(checkpoint_path)
+    settings = dict(state['settings'], checkpoint_path=checkpoint_path)
+    settings.update(kwargs)
+    return solve(students, seats, compatibility_matrix, seat_distances, front_rows,
+                 verbose=verbose, on_generation=on_generation, resume_from=state, **settings)
+
+def reoptimize(previous_names, previous_assignment, students, seats, compatibility_matrix, seat_distances,
+               front_rows, seed_fraction=0.5, stall_generations=15, previous_conflicts=None, **kwargs):
+    """
+    Arranque en caliente tras editar la lista de estudiantes. `previous_names` y
+    `previous_assignment` son los nombres y la mejor asignación de la ejecución
+    anterior; los estudiantes que siguen en la lista conservan su asiento, los nuevos
+    ocupan los asientos libres (core.seeding.warm_start_assignment) y la población se
+    siembra alrededor de esa asignación. Solo se reacomodan los estudiantes afectados
+    por el cambio (core.seeding.unaffected_students); el resto queda fijo (`pinned`)
+    para que el plano no cambie más de lo necesario. Si también cambiaron las
+    incompatibilidades, `previous_conflicts` (las aristas (i, j) de la ejecución
+    anterior, con índices de `previous_names`) marca como afectados a quienes ganaron o
+    perdieron alguna. Como parte de una solución ya buena, por defecto se detiene tras
+    `stall_generations` sin mejora. Acepta los mismos parámetros que solve() y devuelve
+    un GAResult.
+    """
+    instance = kwargs.pop('instance', None)
+    if instance is None:
+        instance = ProblemInstance(students, seats, compatibility_matrix, seat_distances,
+                                   conflict_edges=kwargs.get('conflict_edges'))
+    old_index = roster_mapping(previous_names, [student.name for student in students])
+    initial = warm_start_assignment(instance, previous_assignment, old_index)
+    if 'pinned' not in kwargs:
+        unaffected = np.flatnonzero(unaffected_students(instance, initial, previous_assignment, old_index,
+                                                        previous_conflicts))
+        kwargs['pinned'] = np.column_stack([unaffected, initial[unaffected]])
+    return solve(students, seats, compatibility_matrix, seat_distances, front_rows, instance=instance,
+                 initial_assignment=initial, seed_fraction=seed_fraction, stall_generations=stall_generations,
+                 **kwargs)
+
+def run_ga(students, seats, compatibility_matrix, seat_distances, front_rows,
+           ngen=150, pop_size=200, cxpb=0.8, mutpb=0.2, **kwargs):
+    """
+    Ejecuta el algoritmo genético y devuelve (top_solutions, logbook).
+    Acepta los mismos parámetros que solve(), incluidos los criterios de parada.
+    """
+    result = solve(students, seats, compatibility_matrix, seat_distances, front_rows,
+                   ngen=ngen, pop_size=pop_size, cxpb=cxpb, mutpb=mutpb, **kwargs)
+    return result.solutions, result.logbook
@@ -0,0 +1,101 @@
+# Hall-of-fame acotado: conserva las k mejores asignaciones distintas vistas en la ejecución.
+
+import heapq
+
+import numpy as np
+
+from core.cache import chromosome_key
+
+class HallOfFame:
+    """
+    Montículo de mínimos con las `maxsize` mejores soluciones y un conjunto con sus
+    huellas para descartar repetidos en O(1). Cada actualización cuesta O(k log k)
+    y no depende de cuántos individuos se hayan visto a lo largo de la ejecución.
+    """
+    def __init__(self, maxsize=3):
+        self.maxsize = maxsize
+        self._heap = []
+        self._keys = set()
+        self._seq = 0
+
+    def __len__(self):
+        return len(self._heap)
+
+    def _full(self):
+        return len(self._heap) >= self.maxsize
+
+    def push(self, assignment, fitness):
+        """Intenta añadir una asignación; devuelve True si entró al hall-of-fame."""
+        if self.maxsize <= 0 or (self._full() and fitness <= self._heap[0][0]):
+            return False
+        key = chromosome_key(assignment)
+        if key in self._keys:
+            return False
+        # Con fitness iguales el más reciente queda abajo y es el primero en salir.
+        self._seq += 1
+        entry = (float(fitness), -self._seq, key, [int(seat) for seat in assignment])
+        if self._full():
+            evicted = heapq.heapreplace(self._heap, entry)
+            self._keys.discard(evicted[2])
+        else:
+            heapq.heappush(self._heap, entry)
+        self._keys.add(key)
+        return True
+
+    def _offer(self, population, num_students, order):
+        # Devuelve True en cuanto el resto de candidatos ya no puede entrar.
+        fitness = population.fitness
+        for i in order:
+            if self._full() and fitness[i] <= self._heap[0][0]:
+                return True
+            self.push(population.genes[i, :num_students], fitness[i])
+        return False
+
+    def update(self, population, num_students):
+        """Considera solo a los mejores de la generación, de mayor a menor fitness."""
+        fitness = population.fitness
+        if len(fitness) == 0 or self.maxsize <= 0:
+            return
+        # Margen para repetidos; solo si no alcanza se ordena el resto de la generación.
+        k = min(len(fitness), 2 * self.maxsize)
+        top = np.argpartition(-fitness, k - 1)[:k]
+        if self._offer(population, num_students, top[np.argsort(-fitness[top], kind='stable')]):
+            return
+        if k < len(fitness):
+            rest = np.setdiff1d(np.arange(len(fitness)), top)
+            self._offer(population, num_students, rest[np.argsort(-fitness[rest], kind='stable')])
+
+    def merge(self, other):
+        for fitness, assignment in other.items():
+            self.push(assignment, fitness)
+
+    def items(self):
+        """Pares (fitness, asignación) del mejor al peor."""
+        ordered = sorted(self._heap, key=lambda entry: (-entry[0], -entry[1]))
+        return [(fitness, list(assignment)) for fitness, _, _, assignment in ordered]
+
+    def best(self):
+        """Par (fitness, asignación) del mejor miembro, o (None, None) si está vacío."""
+        if not self._heap:
+            return None, None
+        fitness, _, _, assignment = max(self._heap, key=lambda entry: (entry[0], entry[1]))
+        return fitness, list(assignment)
+
+    def entries(self):
+        """Estado completo para guardarlo: (fitness, orden de llegada, asignación) y el siguiente orden."""
+        return [(fitness, -neg_seq, assignment) for fitness, neg_seq, _, assignment in self._heap], self._seq
+
+    @classmethod
+    def from_entries(cls, maxsize, entries, seq):
+        """Reconstruye un hall-of-fame idéntico al que produjo entries()."""
+        hof = cls(maxsize)
+        for fitness, order, assignment in entries:
+            assignment = [int(seat) for seat in assignment]
+            key = chromosome_key(assignment)
+            heapq.heappush(hof._heap, (float(fitness), -int(order), key, assignment))
+            hof._keys.add(key)
+        hof._seq = int(seq)
+        return hof
+
+    def solutions(self):
+        return [assignment for _, assignment in self.items()]
@@ -0,0 +1,152 @@
+# Instancia compilada del problema: todas las tablas que usan las penalizaciones se
+# calculan una vez por ejecución, así cada evaluación es solo indexar y sumar arreglos.
+
+from functools import lru_cache
+
+import numpy as np
+
+def build_conflict_edges(compatibility_matrix):
+    """
+    Convierte la matriz de compatibilidad en una lista compacta de aristas (i < j)
+    con las parejas marcadas con 1. Se construye una sola vez por ejecución para que
+    cada evaluación cueste O(#conflictos) en lugar de O(n²).
+    """
+    pairs_i, pairs_j = np.nonzero(np.triu(np.asarray(compatibility_matrix) == 1, k=1))
+    return pairs_i.astype(np.intp), pairs_j.astype(np.intp)
+
+def edges_from_pairs(pairs):
+    """
+    Lista de aristas (i < j, sin repetidos) a partir de parejas incompatibles (i, j)
+    en cualquier orden. Evita construir la matriz n x n en instancias grandes.
+    """
+    pairs = np.asarray(list(pairs), dtype=np.intp).reshape(-1, 2)
+    pairs = np.unique(np.sort(pairs[pairs[:, 0] != pairs[:, 1]], axis=1), axis=0)
+    return pairs[:, 0].copy(), pairs[:, 1].copy()
+
+def build_room(rows, cols, first_distance=2.0, row_spacing=1.0):
+    """
+    Aula rectangular de `rows` x `cols` asientos numerados desde (1, 1). La distancia
+    al pizarrón crece `row_spacing` metros por fila a partir de `first_distance`.
+    Devuelve (seats, seat_distances).
+    """
+    seats = [(r + 1, c + 1) for r in range(rows) for c in range(cols)]
+    seat_distances = {(r + 1, c + 1): first_distance + r * row_spacing for r in range(rows) for c in range(cols)}
+    return seats, seat_distances
+
+class RoomLayout:
+    """
+    Tablas que dependen solo del aula; se comparten entre ejecuciones con el mismo aula.
+    En lugar de una matriz asientos x asientos de cercanía se guarda un índice espacial:
+    una rejilla (fila, columna) -> asiento y, para cada asiento, sus vecinos de la
+    vecindad de 8 (más él mismo). Así el aula ocupa O(asientos) memoria aunque tenga
+    miles de lugares. Las coordenadas de los asientos deben ser enteras.
+    """
+    OFFSETS = [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1)]
+
+    def __init__(self, seats, distances):
+        self.seats = list(seats)
+        self.seat_rows = np.array([seat[0] for seat in seats], dtype=np.intp)
+        self.seat_cols = np.array([seat[1] for seat in seats], dtype=np.intp)
+        self.seat_dists = np.array(distances, dtype=float)
+
+        # Rejilla con un borde de -1 para que los vecinos de los asientos de la orilla no se salgan.
+        self.row_offset = int(self.seat_rows.min()) - 1 if len(seats) else 0
+        self.col_offset = int(self.seat_cols.min()) - 1 if len(seats) else 0
+        height = int(self.seat_rows.max()) - self.row_offset + 2 if len(seats) else 1
+        width = int(self.seat_cols.max()) - self.col_offset + 2 if len(seats) else 1
+        self.grid = np.full((height, width), -1, dtype=np.intp)
+        self.grid[self.seat_rows - self.row_offset, self.seat_cols - self.col_offset] = np.arange(len(self.seats))
+
+        # Regla de cercanía: |Δfila| <= 1 y |Δcolumna| <= 1 (incluye el mismo asiento).
+        self.neighbors = np.stack([self.grid[self.seat_rows - self.row_offset + dr,
+                                             self.seat_cols - self.col_offset + dc]
+                                   for dr, dc in self.OFFSETS], axis=1)
+        for table in (self.seat_rows, self.seat_cols, self.seat_dists, self.grid, self.neighbors):
+            table.setflags(write=False)
+
+    def close(self, seat_a, seat_b):
+        """Regla de cercanía entre asientos (acepta escalares o arreglos con broadcasting)."""
+        return ((np.abs(self.seat_rows[seat_a] - self.seat_rows[seat_b]) <= 1) &
+                (np.abs(self.seat_cols[seat_a] - self.seat_cols[seat_b]) <= 1))
+
+@lru_cache(maxsize=16)
+def _compiled_layout(seats, distances):
+    return RoomLayout(seats, distances)
+
+def compile_layout(seats, seat_distances):
+    """Devuelve las tablas del aula, reutilizando las ya compiladas para el mismo aula."""
+    seats = tuple(tuple(seat) for seat in seats)
+    return _compiled_layout(seats, tuple(float(seat_distances[seat]) for seat in seats))
+
+class ProblemInstance:
+    """
+    Problema compilado para una ejecución:
+      - layout: tablas del aula con el índice espacial de vecinos (RoomLayout).
+      - optimas / needs: distancia óptima de cada estudiante y si tiene necesidad de visión.
+      - empty_penalty: penalización (d_max - distancia) de cada asiento si queda vacío.
+      - conflict_i / conflict_j: aristas de incompatibilidad.
+      - d_max y los divisores de normalización de cada penalización.
+    Evaluar un individuo cuesta O(estudiantes + conflictos + asientos): no se guarda
+    ninguna tabla cuadrática. Con `conflict_edges` la matriz de compatibilidad puede ser None.
+    """
+    def __init__(self, students, seats, compatibility_matrix, seat_distances, d_max=None, conflict_edges=None):
+        self.students = students
+        self.layout = compile_layout(seats, seat_distances)
+        self.seats = self.layout.seats
+        self.seat_distances = seat_distances
+        self.compatibility_matrix = compatibility_matrix
+        self.num_students = len(students)
+        self.seats_count = len(seats)
+        if d_max is None:
+            d_max = max(seat_distances.values()) if seat_distances else 1
+        self.d_max = d_max
+
+        self.empty_penalty = d_max - self.layout.seat_dists
+        self.optimas = np.array([student.distancia_optima for student in students], dtype=float)
+        self.needs = self.optimas > 0
+
+        if conflict_edges is None:
+            conflict_edges = build_conflict_edges(compatibility_matrix)
+        self.conflict_i, self.conflict_j = conflict_edges
+
+        self.vision_norm = max(int(self.needs.sum()), 1)
+        self.conflict_norm = max(len(self.conflict_i), 1)
+
+    @property
+    def conflict_edges(self):
+        return self.conflict_i, self.conflict_j
+
+    def close(self, seat_a, seat_b):
+        return self.layout.close(seat_a, seat_b)
+
+    def vision(self, student_idx, seat_idx):
+        """Error de visión de estudiantes en asientos (índices con broadcasting; 0 si visión normal)."""
+        return np.abs(self.layout.seat_dists[seat_idx] - self.optimas[student_idx]) * self.needs[student_idx]
+
+    def fitness_from_penalties(self, v_penalty, c_penalty, e_penalty):
+        return 1 / ((v_penalty / self.d_max + 1) * (c_penalty / 50.0 + 1) * (e_penalty / self.d_max + 1))
+
+    def penalties(self, pop_matrix):
+        """Las tres penalizaciones (visión, compatibilidad, asientos vacíos) de cada fila."""
+        pop = np.asarray(pop_matrix, dtype=np.intp)
+        if pop.ndim == 1:
+            pop = pop[np.newaxis, :]
+        pop = pop[:, :self.num_students]
+        pop_size = pop.shape[0]
+
+        v_penalty = self.vision(np.arange(self.num_students), pop).sum(axis=1) / self.vision_norm
+
+        close = self.close(pop[:, self.conflict_i], pop[:, self.conflict_j])
+        c_penalty = 50.0 * close.sum(axis=1) / self.conflict_norm
+
+        occupied = np.zeros((pop_size, self.seats_count), dtype=bool)
+        occupied[np.arange(pop_size)[:, np.newaxis], pop] = True
+        empty = ~occupied
+        e_penalty = (empty * self.empty_penalty).sum(axis=1) / np.maximum(empty.sum(axis=1), 1)
+        return v_penalty, c_penalty, e_penalty
+
+    def evaluate_population(self, pop_matrix):
+        return self.fitness_from_penalties(*self.penalties(pop_matrix))
+
+    def evaluate(self, assignment):
+        return float(self.evaluate_population(assignment)[0])
@@ -0,0 +1,175 @@
+# Modelo de islas: varias subpoblaciones evolucionan en paralelo (un proceso por isla)
+# y cada cierto número de generaciones intercambian a sus mejores individuos.
+# El ProblemInstance y los parámetros llegan a cada proceso una sola vez (initializer
+# del pool); en cada época solo viajan la población, el hall-of-fame y el estado de
+# los generadores aleatorios.
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+
+from core.cache import FitnessCache
+from core.hall_of_fame import HallOfFame
+from core.instance import ProblemInstance
+from core.seeding import seed_population
+from core.genetic import (
+    _make_rngs, _init_population, _make_offspring, _assign_fitness,
+    _stats_record, _print_record, _resolve_operators
+)
+
+# Datos compartidos por todas las épocas de un proceso del pool (ver _init_worker).
+_worker_context = None
+
+def _init_worker(instance, settings):
+    global _worker_context
+    _worker_context = (instance, settings)
+
+def _rng_states(rngs):
+    rng, py_rng = rngs
+    return rng.bit_generator.state, py_rng.getstate()
+
+def _restore_rngs(states):
+    rng_state, py_rng_state = states
+    rng = np.random.default_rng()
+    rng.bit_generator.state = rng_state
+    py_rng = random.Random()
+    py_rng.setstate(py_rng_state)
+    return rng, py_rng
+
+def _evolve_island(task, context=None):
+    """
+    Trabajo de un proceso: evoluciona una isla durante `ngen` generaciones y devuelve
+    su población, su hall-of-fame, los registros por generación y el estado de sus
+    generadores aleatorios para la siguiente época. `context` es (instance, settings);
+    por defecto el que recibió el proceso al iniciarse.
+    """
+    instance, settings = _worker_context if context is None else context
+    (population, hof, rng_states, first_gen, ngen) = task
+    rng, py_rng = _restore_rngs(rng_states)
+    num_students = instance.num_students
+    # La caché vive solo durante la época: no vale la pena enviarla entre procesos.
+    cache = FitnessCache(settings['cache_size']) if settings['cache_size'] else None
+
+    records = []
+    for gen in range(first_gen, first_gen + ngen):
+        cache_counters = cache.counters() if cache is not None else (0, 0)
+        _make_offspring(population, instance.seats_count, settings['cxpb'], settings['mutpb'],
+                        settings['permutation'], settings['crossover'], settings['mutation'], rng, py_rng)
+        _assign_fitness(population, instance, cache=cache)
+        hof.update(population, num_students)
+        records.append(_stats_record(gen, population.fitness, cache, cache_counters))
+    return population, hof, records, _rng_states((rng, py_rng))
+
+def _migrate(islands, migrants):
+    # Topología en anillo: los mejores de la isla i reemplazan a los peores de la isla i+1.
+    best = []
+    for pop in islands:
+        rows = np.argsort(-pop.fitness, kind='stable')[:migrants]
+        best.append((pop.genes[rows].copy(), pop.fitness[rows].copy()))
+    for i, pop in enumerate(islands):
+        genes, fitness = best[i - 1]
+        worst = np.argsort(pop.fitness, kind='stable')[:len(fitness)]
+        pop.genes[worst] = genes
+        pop.fitness[worst] = fitness
+
+def run_islands(students, seats, compatibility_matrix, seat_distances, front_rows,
+                ngen=150, pop_size=200, cxpb=0.8, mutpb=0.2, encoding='integer',
+                crossover=None, mutation=None, n_islands=4, migration_interval=10,
+                migrants=2, processes=None, seed=None, cache_size=10000, hof_size=3,
+                seeding=None, seed_fraction=0.2, instance=None, conflict_edges=None, verbose=True):
+    """
+    Ejecuta el algoritmo genético con `n_islands` subpoblaciones de `pop_size` individuos
+    repartidas en un pool de procesos. Cada `migration_interval` generaciones los
+    `migrants` mejores de cada isla pasan a la siguiente (anillo). Al final se fusionan
+    los hall-of-fame de todas las islas.
+
+    Cada isla tiene su propio generador derivado de `seed`, así que para una misma
+    semilla el resultado no depende del número de procesos. Con processes=1 todo se
+    ejecuta en el proceso actual. Devuelve (top_solutions, logbook) igual que run_ga.
+    `seeding` y `seed_fraction` siembran cada isla igual que en solve().
+    `instance` permite reutilizar un ProblemInstance ya compilado para estos datos; con
+    `conflict_edges` la matriz de compatibilidad puede ser None, igual que en solve().
+    Con verbose=False no se imprime nada por generación.
+    """
+    crossover, mutation = _resolve_operators(encoding, crossover, mutation)
+    if n_islands < 1 or migration_interval < 1:
+        raise ValueError("n_islands y migration_interval deben ser al menos 1")
+    if seeding not in (None, 'assignment'):
+        raise ValueError(f"Modo de siembra desconocido: {seeding}")
+
+    if instance is None:
+        instance = ProblemInstance(students, seats, compatibility_matrix, seat_distances,
+                                   conflict_edges=conflict_edges)
+    num_students = instance.num_students
+    settings = {
+        'cxpb': cxpb, 'mutpb': mutpb, 'permutation': encoding == 'permutation',
+        'crossover': crossover, 'mutation': mutation, 'cache_size': cache_size,
+    }
+
+    island_rngs = [_make_rngs(island_seed) for island_seed in np.random.SeedSequence(seed).spawn(n_islands)]
+    islands = []
+    hofs = []
+    for rng, _ in island_rngs:
+        seeds = None
+        if seeding == 'assignment':
+            seed_count = min(pop_size, max(1, int(round(seed_fraction * pop_size))))
+            seeds = seed_population(instance, seed_count, rng, settings['permutation'])
+        population = _init_population(pop_size, num_students, instance.seats_count, settings['permutation'], rng, seeds)
+        _assign_fitness(population, instance, cache=None)
+        islands.append(population)
+        hof = HallOfFame(hof_size)
+        hof.update(population, num_students)
+        hofs.append(hof)
+
+    if verbose:
+        print(f"=== INICIANDO MODELO DE ISLAS ({n_islands} islas) ===")
+    logbook = []
+    executor = None
+    if processes != 1:
+        executor = ProcessPoolExecutor(max_workers=processes, initializer=_init_worker,
+                                       initargs=(instance, settings))
+    evolve = partial(_evolve_island, context=(instance, settings))
+    try:
+        gen = 1
+        while gen <= ngen:
+            epoch = min(migration_interval, ngen - gen + 1)
+            tasks = [(islands[i], hofs[i], _rng_states(island_rngs[i]), gen, epoch) for i in range(n_islands)]
+            results = executor.map(_evolve_island, tasks) if executor else map(evolve, tasks)
+            island_records = []
+            for i, (population, hof, records, rng_states) in enumerate(results):
+                islands[i], hofs[i], island_rngs[i] = population, hof, _restore_rngs(rng_states)
+                island_records.append(records)
+
+            for k in range(epoch):
+                # Todas las islas tienen el mismo tamaño: el promedio global es el promedio de promedios.
+                stats_record = {
+                    'gen': gen + k,
+                    'avg': np.mean([records[k]['avg'] for records in island_records]),
+                    'max': np.max([records[k]['max'] for records in island_records]),
+                    'min': np.min([records[k]['min'] for records in island_records]),
+                }
+                if cache_size:
+                    stats_record['cache_hits'] = sum(records[k]['cache_hits'] for records in island_records)
+                    stats_record['cache_misses'] = sum(records[k]['cache_misses'] for records in island_records)
+                logbook.append(stats_record)
+                if verbose:
+                    _print_record(stats_record)
+
+            gen += epoch
+            if n_islands > 1 and gen <= ngen:
+                _migrate(islands, migrants)
+    finally:
+        if executor:
+            executor.shutdown()
+
+    if verbose:
+        print("=== ALGORITMO COMPLETADO ===")
+
+    hof = HallOfFame(hof_size)
+    for island_hof in hofs:
+        hof.merge(island_hof)
+    top_solutions = hof.solutions()
+
+    return top_solutions, logbook
@@ -0,0 +1,156 @@
+# Búsqueda local (etapa memética): escalada por intercambios de asiento entre dos
+# estudiantes y por movimientos de un estudiante a un asiento vacío. En cada paso se
+# puntúa un conjunto acotado de candidatos con la evaluación incremental, así que el
+# costo de un paso no depende del tamaño del aula ni del número de estudiantes.
+
+import time
+
+import numpy as np
+
+from core.delta import IncrementalEvaluator, swap_changes
+from core.hall_of_fame import HallOfFame
+
+IMPROVEMENT_EPS = 1e-12
+# Estudiantes al azar que se suman en cada paso a los que tienen penalización, para
+# también probar movimientos que solo mejoran el término de asientos vacíos.
+EXPLORE_STUDENTS = 4
+# Asientos candidatos por estudiante, además de los aleatorios: a la distancia de su
+# visión y los asientos vacíos más costosos.
+VISION_TARGETS = 4
+EMPTY_TARGETS = 4
+
+def _candidate_moves(evaluator, instance, rng, max_students, seats_per_student, fixed=None):
+    """
+    Genera las listas de cambios de un paso. Los estudiantes candidatos son los que
+    tienen error de visión o un compañero incompatible cerca (a lo más `max_students`,
+    muestreados) y unos pocos al azar; para cada uno se prueban `seats_per_student`
+    asientos al azar, asientos a su distancia óptima y los asientos vacíos que más
+    penalizan. Si el asiento está ocupado el cambio es un intercambio; si no, un movimiento.
+    Los estudiantes marcados en `fixed` (máscara booleana) no se mueven.
+    """
+    n = instance.num_students
+    layout = instance.layout
+    seats_count = instance.seats_count
+    seats_of = np.array(evaluator.chromosome, dtype=np.intp)
+
+    close = instance.close(seats_of[instance.conflict_i], seats_of[instance.conflict_j])
+    penalized = instance.vision(np.arange(n), seats_of) > 0
+    penalized[instance.conflict_i[close]] = True
+    penalized[instance.conflict_j[close]] = True
+    movable = np.arange(n) if fixed is None else np.flatnonzero(~fixed)
+    if len(movable) == 0:
+        return
+    students = movable[penalized[movable]]
+    if len(students) > max_students:
+        students = rng.choice(students, max_students, replace=False)
+    students = np.union1d(students, movable[rng.integers(0, len(movable), size=min(EXPLORE_STUDENTS, n))])
+
+    # Asientos ordenados por distancia: los vecinos de la posición de la distancia
+    # óptima de cada estudiante están a (casi) esa distancia del pizarrón.
+    by_distance = np.argsort(layout.seat_dists, kind='stable')
+    position = np.searchsorted(layout.seat_dists[by_distance], instance.optimas[students])
+    spread = 4 * seats_per_student
+    near = position[:, np.newaxis] + rng.integers(-spread, spread + 1, size=(len(students), VISION_TARGETS))
+    empty = np.flatnonzero(evaluator.seat_counts == 0)
+    costly = empty[np.argsort(-instance.empty_penalty[empty], kind='stable')[:EMPTY_TARGETS]]
+    targets = np.hstack([
+        rng.integers(0, seats_count, size=(len(students), seats_per_student)),
+        by_distance[np.clip(near, 0, seats_count - 1)],
+        np.broadcast_to(costly, (len(students), len(costly))),
+    ])
+
+    occupant = np.full(seats_count, -1, dtype=np.intp)
+    occupant[seats_of] = np.arange(n)
+    for a, row in zip(students.tolist(), targets.tolist()):
+        for seat in dict.fromkeys(row):
+            if seat == evaluator.chromosome[a]:
+                continue
+            b = int(occupant[seat])
+            if b >= 0 and fixed is not None and fixed[b]:
+                continue
+            yield swap_changes(evaluator.chromosome, a, b) if b >= 0 else [(a, seat)]
+
+def _stopped(deadline, should_stop):
+    return (deadline is not None and time.perf_counter() >= deadline) or \
+        (should_stop is not None and should_stop())
+
+def hill_climb(assignment, instance, strategy='best', max_steps=50, rng=None, deadline=None, should_stop=None,
+               max_students=24, seats_per_student=8, fixed=None):
+    """
+    Mejora una asignación con movimientos swap/move hasta que ningún candidato del paso
+    mejora o se aplican `max_steps` movimientos.
+    strategy='first' aplica el primer candidato que mejora; strategy='best' el mejor.
+    `deadline` (instante de time.perf_counter()) y `should_stop()` se revisan antes de
+    cada paso. `rng` (np.random.Generator) elige los candidatos. Los estudiantes
+    marcados en `fixed` (máscara booleana) conservan su asiento.
+    Devuelve (asignación, fitness, movimientos aplicados).
+    """
+    if strategy not in ('first', 'best'):
+        raise ValueError(f"Estrategia de búsqueda local desconocida: {strategy}")
+    rng = np.random.default_rng() if rng is None else rng
+    evaluator = IncrementalEvaluator(assignment, instance)
+
+    steps = 0
+    while steps < max_steps and not _stopped(deadline, should_stop):
+        best_fitness = evaluator.fitness + IMPROVEMENT_EPS
+        best_changes = None
+        for changes in _candidate_moves(evaluator, instance, rng, max_students, seats_per_student, fixed):
+            fitness = evaluator.evaluate_changes(changes)
+            if fitness > best_fitness:
+                best_fitness, best_changes = fitness, changes
+                if strategy == 'first':
+                    break
+        if best_changes is None:
+            break
+        evaluator.apply_changes(best_changes)
+        steps += 1
+    return list(evaluator.chromosome), evaluator.fitness, steps
+
+def _write_assignment(row, assignment, permutation):
+    # En codificación por permutación la cola (asientos vacíos) debe seguir siendo
+    # el complemento de la asignación; se conserva su orden relativo.
+    if permutation:
+        assigned = set(assignment)
+        tail = [seat for seat in row.tolist() if seat not in assigned]
+        row[len(assignment):] = tail
+    row[:len(assignment)] = assignment
+
+def refine_population(population, instance, top_k=2, strategy='best', max_steps=20, permutation=False, rng=None,
+                      fixed=None, deadline=None, should_stop=None):
+    """
+    Aplica hill_climb a los `top_k` mejores individuos de la población y escribe en
+    el sitio las mejoras (genes y fitness). Devuelve cuántos individuos mejoraron.
+    Con `deadline` o `should_stop` se deja de refinar en cuanto se cumplen.
+    """
+    fitness = population.fitness
+    k = min(top_k, len(fitness))
+    if k <= 0:
+        return 0
+    improved = 0
+    for i in np.argpartition(-fitness, k - 1)[:k]:
+        if _stopped(deadline, should_stop):
+            break
+        row = population.genes[i]
+        assignment, new_fitness, steps = hill_climb(row[:instance.num_students], instance, strategy, max_steps, rng,
+                                                    deadline, should_stop, fixed=fixed)
+        if steps:
+            _write_assignment(row, assignment, permutation)
+            fitness[i] = new_fitness
+            improved += 1
+    return improved
+
+def refine_hall_of_fame(hof, instance, strategy='best', max_steps=20, rng=None, deadline=None, should_stop=None,
+                        fixed=None):
+    """
+    Devuelve un nuevo HallOfFame con los miembros de `hof` refinados (y los originales).
+    Con `deadline` o `should_stop` se deja de refinar en cuanto se cumplen; los
+    miembros que falten pasan sin cambios.
+    """
+    refined = HallOfFame(hof.maxsize)
+    for fitness, assignment in hof.items():
+        if not _stopped(deadline, should_stop):
+            new_assignment, new_fitness, _ = hill_climb(assignment, instance, strategy, max_steps, rng,
+                                                        deadline, should_stop, fixed=fixed)
+            refined.push(new_assignment, new_fitness)
+        refined.push(assignment, fitness)
+    return refined
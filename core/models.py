@@ -1,9 +1,28 @@
 # Este archivo define las estructuras de datos básicas del proyecto.
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 @dataclass
 class Student:
     name: str
     distancia_optima: float  # Distancia ideal en metros. 0 significa visión normal (ignorar).
-    index: int   # La posición del estudiante en la lista original, útil para la matriz de compatibilidad.
\ No newline at end of file
+    index: int   # La posición del estudiante en la lista original, útil para la matriz de compatibilidad.
+
+@dataclass
+class GAResult:
+    solutions: list  # Mejores asignaciones (estudiante -> índice de asiento), de mejor a peor.
+    fitness: list  # Fitness de cada solución en `solutions`.
+    logbook: list = field(default_factory=list)  # Un registro de estadísticas por generación.
+    stop_reason: str = 'max_generations'  # Criterio que detuvo la ejecución.
+    generations: int = 0  # Generaciones completadas.
+    evaluations: int = 0  # Evaluaciones de fitness realizadas (sin aciertos de caché).
+    elapsed: float = 0.0  # Segundos de reloj de la ejecución.
+
+@dataclass
+class GenerationEvent:
+    gen: int  # Número de generación (desde 1).
+    stats: dict  # Registro de estadísticas de la generación (el que va al logbook).
+    best_fitness: float  # Mejor fitness encontrado hasta esta generación.
+    best_solution: list  # Mejor asignación encontrada hasta esta generación.
+    evaluations: int  # Evaluaciones de fitness acumuladas.
+    elapsed: float  # Segundos de reloj desde el inicio de la ejecución.
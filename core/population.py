@@ -0,0 +1,84 @@
+# Población compacta: todos los cromosomas viven en una sola matriz NumPy de enteros
+# y los fitness en un vector. Cada generación se escribe en un segundo búfer y luego
+# se intercambian, así que no se crean objetos por individuo ni se usa deepcopy.
+
+import numpy as np
+
+class IndividualView:
+    """
+    Vista ligera de una fila de la población, compatible con Individual
+    (atributos `chromosome` y `fitness`). No copia datos: lee y escribe en los búferes.
+    """
+    __slots__ = ('_population', '_index')
+
+    def __init__(self, population, index):
+        self._population = population
+        self._index = index
+
+    @property
+    def chromosome(self):
+        return self._population.genes[self._index]
+
+    @chromosome.setter
+    def chromosome(self, value):
+        self._population.genes[self._index] = value
+
+    @property
+    def fitness(self):
+        return float(self._population.fitness[self._index])
+
+    @fitness.setter
+    def fitness(self, value):
+        self._population.fitness[self._index] = value
+
+class Population:
+    """
+    Matriz `genes` (individuos x genes) y vector `fitness`, más un búfer de reserva
+    del mismo tamaño donde se construye la siguiente generación.
+    """
+    def __init__(self, size, length):
+        self.genes = np.zeros((size, length), dtype=np.intp)
+        self.fitness = np.zeros(size)
+        self._next_genes = np.zeros_like(self.genes)
+        self._next_fitness = np.zeros_like(self.fitness)
+
+    @classmethod
+    def from_chromosomes(cls, chromosomes):
+        genes = np.asarray(chromosomes, dtype=np.intp)
+        population = cls(genes.shape[0], genes.shape[1])
+        population.genes[:] = genes
+        return population
+
+    def __len__(self):
+        return self.genes.shape[0]
+
+    def __getitem__(self, index):
+        return IndividualView(self, index)
+
+    def __iter__(self):
+        return (IndividualView(self, i) for i in range(len(self)))
+
+    def __getstate__(self):
+        # El búfer de reserva no forma parte del estado (se omite al enviar islas entre procesos).
+        return {'genes': self.genes, 'fitness': self.fitness}
+
+    def __setstate__(self, state):
+        self.genes = state['genes']
+        self.fitness = state['fitness']
+        self._next_genes = np.zeros_like(self.genes)
+        self._next_fitness = np.zeros_like(self.fitness)
+
+    @property
+    def next_genes(self):
+        """Búfer donde se escriben los genes de la siguiente generación."""
+        return self._next_genes
+
+    def clone_into_next(self, indices):
+        """Copia las filas `indices` (por ejemplo, los padres seleccionados) al búfer de reserva."""
+        np.take(self.genes, indices, axis=0, out=self._next_genes)
+        np.take(self.fitness, indices, out=self._next_fitness)
+
+    def swap(self):
+        """La generación construida en el búfer de reserva pasa a ser la actual."""
+        self.genes, self._next_genes = self._next_genes, self.genes
+        self.fitness, self._next_fitness = self._next_fitness, self.fitness
@@ -0,0 +1,100 @@
+# Instrumentación opcional del ciclo del algoritmo genético: tiempo de reloj por fase y
+# contadores por generación, y opcionalmente un volcado de cProfile. Sin perfilado se
+# usa NULL_PROFILER, cuyos métodos no hacen nada, así que el ciclo no paga por ello.
+
+import cProfile
+import time
+
+PHASES = ('selection', 'clone', 'crossover', 'mutation', 'repair', 'evaluation', 'local_search', 'hall_of_fame')
+COUNTERS = ('evaluations', 'repairs', 'duplicates_fixed')
+
+class NullProfiler:
+    """Perfilador que no mide nada (ejecución normal)."""
+    def begin(self):
+        pass
+
+    def lap(self, phase):
+        pass
+
+    def count(self, counter, amount):
+        pass
+
+    def record(self):
+        return {}
+
+    def pause(self):
+        pass
+
+    def resume(self):
+        pass
+
+    def finish(self):
+        pass
+
+NULL_PROFILER = NullProfiler()
+
+class PhaseProfiler(NullProfiler):
+    """
+    Acumula el tiempo de cada fase de una generación con `lap(fase)`, que asigna a esa
+    fase el tiempo transcurrido desde el `begin()` o `lap()` anterior, y los contadores
+    de COUNTERS con `count()`. `record()` devuelve lo de la generación (claves
+    'time_<fase>' y los contadores) y reinicia. Con `dump_path` además corre cProfile
+    durante la ejecución (en pausa mientras el consumidor procesa cada evento) y guarda
+    las estadísticas en ese archivo para leerlas con pstats.
+    """
+    def __init__(self, dump_path=None):
+        self.dump_path = dump_path
+        self._times = dict.fromkeys(PHASES, 0.0)
+        self._counts = dict.fromkeys(COUNTERS, 0)
+        self._last = time.perf_counter()
+        self._cprofile = cProfile.Profile() if dump_path else None
+        self.resume()
+
+    def begin(self):
+        self._last = time.perf_counter()
+
+    def lap(self, phase):
+        now = time.perf_counter()
+        self._times[phase] += now - self._last
+        self._last = now
+
+    def count(self, counter, amount):
+        self._counts[counter] += int(amount)
+
+    def record(self):
+        record = {f'time_{phase}': elapsed for phase, elapsed in self._times.items()}
+        record.update(self._counts)
+        self._times = dict.fromkeys(PHASES, 0.0)
+        self._counts = dict.fromkeys(COUNTERS, 0)
+        return record
+
+    def pause(self):
+        if self._cprofile is not None:
+            self._cprofile.disable()
+
+    def resume(self):
+        if self._cprofile is not None:
+            self._cprofile.enable()
+
+    def finish(self):
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(self.dump_path)
+
+def make_profiler(profile=False, profile_path=None):
+    """PhaseProfiler si se pidió perfilado (o un volcado de cProfile); si no, NULL_PROFILER."""
+    if profile or profile_path:
+        return PhaseProfiler(profile_path)
+    return NULL_PROFILER
+
+def profile_summary(logbook):
+    """
+    Totales de una ejecución perfilada a partir de su logbook: segundos y fracción del
+    tiempo medido por fase, y la suma de cada contador. Útil para ver qué fase culpar.
+    """
+    totals = {phase: sum(record.get(f'time_{phase}', 0.0) for record in logbook) for phase in PHASES}
+    measured = sum(totals.values()) or 1.0
+    return {
+        'phases': {phase: {'seconds': seconds, 'share': seconds / measured} for phase, seconds in totals.items()},
+        'counters': {counter: sum(record.get(counter, 0) for record in logbook) for counter in COUNTERS},
+    }
@@ -0,0 +1,309 @@
+# Siembra de la población inicial con la solución exacta del problema de asignación
+# lineal formado por los términos separables del fitness (visión y asientos vacíos).
+
+import numpy as np
+
+# ASIGNACIÓN LINEAL
+def _hungarian(cost):
+    """
+    Algoritmo húngaro (caminos de aumento más cortos con potenciales) para una matriz
+    filas x columnas con filas <= columnas. El recorrido interno sobre las columnas
+    está vectorizado. Devuelve la columna asignada a cada fila.
+    """
+    n, m = cost.shape
+    # Índices desplazados en 1: la columna 0 es ficticia y marca "sin asignar".
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    owner = np.zeros(m + 1, dtype=np.intp)
+    way = np.zeros(m + 1, dtype=np.intp)
+
+    # Arranque voraz: con u = mínimo de cada fila, cada fila toma si puede una columna
+    # libre de costo reducido 0. Con muchos empates (estudiantes iguales) esto evita
+    # la mayoría de los caminos de aumento.
+    u[1:] = cost.min(axis=1)
+    pending = []
+    for i in range(1, n + 1):
+        tight = np.flatnonzero((cost[i - 1] == u[i]) & (owner[1:] == 0))
+        if len(tight):
+            owner[tight[0] + 1] = i
+        else:
+            pending.append(i)
+
+    for i in pending:
+        owner[0] = i
+        j0 = 0
+        min_reduced = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[j0] = True
+            i0 = owner[j0]
+            free = ~used[1:]
+            reduced = cost[i0 - 1] - u[i0] - v[1:]
+            better = free & (reduced < min_reduced[1:])
+            min_reduced[1:][better] = reduced[better]
+            way[1:][better] = j0
+            candidates = np.where(free, min_reduced[1:], np.inf)
+            j1 = int(np.argmin(candidates)) + 1
+            delta = candidates[j1 - 1]
+            if owner[j1]:
+                # Entre columnas empatadas se prefiere una sin dueño: el camino termina ya.
+                unowned = np.flatnonzero((candidates == delta) & (owner[1:] == 0))
+                if len(unowned):
+                    j1 = int(unowned[0]) + 1
+            u[owner[used]] += delta
+            v[used] -= delta
+            min_reduced[~used] -= delta
+            j0 = j1
+            if owner[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            owner[j0] = owner[j1]
+            j0 = j1
+
+    assignment = np.empty(n, dtype=np.intp)
+    columns = np.flatnonzero(owner[1:])
+    assignment[owner[columns + 1] - 1] = columns
+    return assignment
+
+def _transport(cost, supply, capacity):
+    """
+    Problema de transporte entre tipos de fila (con `supply` filas cada uno) y tipos de
+    columna (con `capacity` columnas cada uno) por caminos de aumento más cortos con
+    Bellman-Ford vectorizado sobre la red residual. Devuelve la matriz de flujo.
+    """
+    types, groups = cost.shape
+    flow = np.zeros((types, groups), dtype=np.intp)
+    supply = supply.copy()
+    capacity = capacity.copy()
+    while supply.sum() > 0:
+        dist_t = np.where(supply > 0, 0.0, np.inf)
+        pred_t = np.full(types, -1)
+        dist_g = np.full(groups, np.inf)
+        pred_g = np.full(groups, -1)
+        while True:
+            # Solo mejoras estrictas, para que los predecesores no formen ciclos con empates.
+            reach = dist_t[:, np.newaxis] + cost
+            via_t = np.argmin(reach, axis=0)
+            new_g = reach[via_t, np.arange(groups)]
+            better_g = new_g < dist_g - 1e-12
+            dist_g[better_g] = new_g[better_g]
+            pred_g[better_g] = via_t[better_g]
+            # Aristas de regreso grupo -> tipo: deshacer flujo ya asignado.
+            back = np.where(flow > 0, dist_g[np.newaxis, :] - cost, np.inf)
+            via_g = np.argmin(back, axis=1)
+            new_t = back[np.arange(types), via_g]
+            better_t = new_t < dist_t - 1e-12
+            if not better_t.any():
+                break
+            dist_t[better_t] = new_t[better_t]
+            pred_t[better_t] = via_g[better_t]
+
+        target = int(np.argmin(np.where(capacity > 0, dist_g, np.inf)))
+        path = []
+        g = target
+        while True:
+            t = int(pred_g[g])
+            path.append((t, g))
+            if pred_t[t] < 0:
+                break
+            g = int(pred_t[t])
+        amount = min(supply[t], capacity[target])
+        for t_back, g_back in zip([t for t, _ in path[:-1]], [g for _, g in path[1:]]):
+            amount = min(amount, flow[t_back, g_back])
+        for i, (t_fwd, g_fwd) in enumerate(path):
+            flow[t_fwd, g_fwd] += amount
+            if i + 1 < len(path):
+                flow[t_fwd, path[i + 1][1]] -= amount
+        supply[t] -= amount
+        capacity[target] -= amount
+    return flow
+
+def _group_equal(matrix):
+    # Agrupa filas idénticas: tipo de cada fila y primera fila de cada tipo.
+    types = {}
+    of = np.array([types.setdefault(row.tobytes(), len(types)) for row in matrix], dtype=np.intp)
+    first = np.zeros(len(types), dtype=np.intp)
+    first[of[::-1]] = np.arange(len(of))[::-1]
+    return of, first
+
+def linear_assignment(cost):
+    """
+    Resuelve de forma exacta el problema de asignación lineal de una matriz de costos
+    filas x columnas (filas <= columnas) usando solo NumPy. Devuelve, para cada fila,
+    la columna asignada de forma que la suma de costos sea mínima.
+    Si hay pocas filas y columnas distintas (estudiantes con la misma distancia óptima,
+    asientos de la misma fila del aula) se resuelve el problema de transporte entre
+    tipos, que es mucho más pequeño; si no, el algoritmo húngaro.
+    """
+    cost = np.asarray(cost, dtype=float)
+    n, m = cost.shape
+    if n > m:
+        raise ValueError("linear_assignment necesita al menos tantas columnas como filas")
+    row_of, row_first = _group_equal(cost)
+    col_of, col_first = _group_equal(cost[row_first].T)
+    if len(row_first) * len(col_first) * 4 > n * m:
+        return _hungarian(cost)
+
+    return grouped_assignment(cost[np.ix_(row_first, col_first)], row_of, col_of)
+
+def grouped_assignment(type_cost, row_of, col_of):
+    """
+    Asignación óptima cuando el costo solo depende del tipo de fila y del tipo de
+    columna: `type_cost[t, g]` es el costo de una fila de tipo t en una columna de
+    tipo g, y `row_of` / `col_of` dan el tipo de cada fila y columna. Nunca construye
+    la matriz completa filas x columnas.
+    """
+    supply = np.bincount(row_of, minlength=type_cost.shape[0])
+    capacity = np.bincount(col_of, minlength=type_cost.shape[1])
+    flow = _transport(type_cost, supply, capacity)
+    rows_by_type = np.argsort(row_of, kind='stable')
+    cols_by_type = np.argsort(col_of, kind='stable')
+    row_start = np.concatenate([[0], np.cumsum(supply)])
+    col_start = np.concatenate([[0], np.cumsum(capacity)])
+    assignment = np.empty(len(row_of), dtype=np.intp)
+    for t, g in zip(*np.nonzero(flow)):
+        amount = flow[t, g]
+        rows = rows_by_type[row_start[t]:row_start[t] + amount]
+        cols = cols_by_type[col_start[g]:col_start[g] + amount]
+        assignment[rows] = cols
+        row_start[t] += amount
+        col_start[g] += amount
+    return assignment
+
+# SIEMBRA DE LA POBLACIÓN INICIAL
+def assignment_cost(instance, students=None, seats=None):
+    """
+    Costo lineal estudiante x asiento: error de visión normalizado más la parte del
+    término de asientos vacíos que se evita al ocupar cada asiento. La compatibilidad
+    no es separable y queda fuera; de ella se encarga el algoritmo genético.
+    `students` y `seats` restringen la matriz a esos índices (por defecto, todos).
+    """
+    if students is None:
+        students = np.arange(instance.num_students)
+    if seats is None:
+        seats = np.arange(instance.seats_count)
+    empty_slots = max(instance.seats_count - instance.num_students, 1)
+    vision = instance.vision(students[:, np.newaxis], seats[np.newaxis, :]) / instance.vision_norm
+    occupied_bonus = instance.empty_penalty[seats] / empty_slots
+    return (vision - occupied_bonus[np.newaxis, :]) / instance.d_max
+
+def optimal_assignment(instance):
+    """
+    Asignación que minimiza el costo lineal de assignment_cost(). El costo solo depende
+    de la distancia óptima del estudiante y de la distancia del asiento, así que se
+    agrupa por esos valores y, si hay pocos distintos, no se construye la matriz n x S.
+    """
+    _, row_of = np.unique(instance.optimas * instance.needs, return_inverse=True)
+    _, col_of = np.unique(instance.layout.seat_dists, return_inverse=True)
+    row_of, col_of = row_of.reshape(-1), col_of.reshape(-1)
+    row_first = np.unique(row_of, return_index=True)[1]
+    col_first = np.unique(col_of, return_index=True)[1]
+    if len(row_first) * len(col_first) * 4 > instance.num_students * instance.seats_count:
+        return linear_assignment(assignment_cost(instance))
+    return grouped_assignment(assignment_cost(instance, row_first, col_first), row_of, col_of)
+
+def seed_population(instance, count, rng, permutation=False, perturbation=0.1, base=None, movable=None):
+    """
+    Genera `count` cromosomas: el primero es la asignación óptima del problema lineal
+    (o `base`, si se da una asignación estudiante -> asiento) y el resto son copias
+    perturbadas con intercambios y movimientos a asientos vacíos (alrededor de
+    `perturbation` * n cambios cada una). Con `movable` (índices de estudiantes) solo
+    esos estudiantes cambian de asiento.
+    """
+    n = instance.num_students
+    best = optimal_assignment(instance) if base is None else np.asarray(base, dtype=np.intp)
+    free = np.setdiff1d(np.arange(instance.seats_count), best)
+    base = np.concatenate([best, free])
+    # Posiciones que pueden intercambiarse: las de los estudiantes movibles y los asientos vacíos.
+    movable = np.arange(n) if movable is None else np.asarray(movable, dtype=np.intp)
+    positions = np.concatenate([movable, np.arange(n, len(base))])
+
+    rows = np.tile(base, (count, 1))
+    changes = max(1, int(round(perturbation * len(movable))))
+    for row in rows[1:] if len(movable) else ():
+        # Cada cambio intercambia la posición k < n con cualquier otra: si la otra es
+        # k' < n es un intercambio de asientos, si es >= n es mover al asiento vacío.
+        for k in movable[rng.integers(0, len(movable), size=changes)]:
+            other = positions[rng.integers(0, len(positions))]
+            row[k], row[other] = row[other], row[k]
+    if permutation:
+        tails = rows[:, n:]
+        rows[:, n:] = rng.permuted(tails, axis=1)
+        return rows
+    return rows[:, :n]
+
+# ARRANQUE EN CALIENTE (cambios en la lista de estudiantes)
+def roster_mapping(old_names, new_names):
+    """Para cada estudiante de la lista nueva, su índice en la anterior (por nombre) o -1 si es nuevo."""
+    position = {name: i for i, name in enumerate(old_names)}
+    return np.array([position.get(name, -1) for name in new_names], dtype=np.intp)
+
+def warm_start_assignment(instance, previous_assignment, old_index):
+    """
+    Asignación completa para la lista actual a partir de la solución anterior: cada
+    estudiante que ya estaba (`old_index[i] >= 0`) conserva su asiento y los nuevos,
+    o los que perdieron el suyo porque el aula cambió, ocupan los asientos libres según
+    la asignación lineal óptima de assignment_cost().
+    """
+    previous_assignment = np.asarray(previous_assignment, dtype=np.intp)
+    old_index = np.asarray(old_index, dtype=np.intp)
+    assignment = np.full(instance.num_students, -1, dtype=np.intp)
+    kept = np.flatnonzero(old_index >= 0)
+    seats = previous_assignment[old_index[kept]]
+    valid = seats < instance.seats_count
+    kept, seats = kept[valid], seats[valid]
+    # Si dos estudiantes traían el mismo asiento, se queda el primero.
+    seats, first = np.unique(seats, return_index=True)
+    assignment[kept[first]] = seats
+
+    pending = np.flatnonzero(assignment < 0)
+    if len(pending):
+        free = np.setdiff1d(np.arange(instance.seats_count), seats)
+        assignment[pending] = free[linear_assignment(assignment_cost(instance, pending, free))]
+    return assignment
+
+def unaffected_students(instance, assignment, previous_assignment, old_index, previous_edges=None):
+    """
+    Máscara de los estudiantes que el cambio de lista no afecta y pueden quedarse fijos
+    en su asiento de `assignment` (la de warm_start_assignment()): los que conservan el
+    asiento anterior, no son incompatibles con un estudiante recién ubicado y no se
+    sientan al lado (vecindad de 8) de un asiento que cambió de ocupante. Con
+    `previous_edges` (las parejas incompatibles anteriores, con los índices de la lista
+    anterior) también quedan afectados los que ganaron o perdieron una incompatibilidad.
+    """
+    assignment = np.asarray(assignment, dtype=np.intp)
+    previous_assignment = np.asarray(previous_assignment, dtype=np.intp)
+    old_index = np.asarray(old_index, dtype=np.intp)
+    kept = old_index >= 0
+    unaffected = kept.copy()
+    unaffected[kept] = previous_assignment[old_index[kept]] == assignment[kept]
+    placed = np.flatnonzero(~unaffected)
+
+    # Asientos que cambiaron de ocupante: los de quienes salieron y los de los recién ubicados.
+    left = np.setdiff1d(np.arange(len(previous_assignment)), old_index[kept])
+    left_seats = previous_assignment[left]
+    changed = np.concatenate([left_seats[left_seats < instance.seats_count], assignment[placed]])
+    near = np.zeros(instance.seats_count, dtype=bool)
+    neighbors = instance.layout.neighbors[changed].ravel()
+    near[neighbors[neighbors >= 0]] = True
+    unaffected &= ~near[assignment]
+
+    is_placed = np.zeros(instance.num_students, dtype=bool)
+    is_placed[placed] = True
+    ci, cj = instance.conflict_i, instance.conflict_j
+    unaffected[ci[is_placed[cj]]] = False
+    unaffected[cj[is_placed[ci]]] = False
+
+    if previous_edges is not None:
+        # Parejas entre estudiantes que siguen en la lista, antes y ahora (índices nuevos).
+        new_of_old = np.full(len(previous_assignment), -1, dtype=np.intp)
+        new_of_old[old_index[kept]] = np.flatnonzero(kept)
+        old_i, old_j = (new_of_old[np.asarray(side, dtype=np.intp)] for side in previous_edges)
+        both_kept = (old_i >= 0) & (old_j >= 0)
+        before = set(zip(np.minimum(old_i, old_j)[both_kept].tolist(), np.maximum(old_i, old_j)[both_kept].tolist()))
+        both_kept = kept[ci] & kept[cj]
+        after = set(zip(np.minimum(ci, cj)[both_kept].tolist(), np.maximum(ci, cj)[both_kept].tolist()))
+        for i, j in before ^ after:
+            unaffected[i] = unaffected[j] = False
+    return unaffected
@@ -1,4 +1,4 @@
-import matplotlib.pyplot as plt
+# matplotlib se importa dentro de la función, solo cuando se dibuja el gráfico.
 
 def plot_evolution(logbook):
 
@@ -6,6 +6,8 @@ def plot_evolution(logbook):
         print("El logbook está vacío, no se puede generar el gráfico de evolución.")
         return
 
+    import matplotlib.pyplot as plt
+
     gen = [record['gen'] for record in logbook]
     max_fitness = [record['max'] for record in logbook]
     avg_fitness = [record['avg'] for record in logbook]
@@ -0,0 +1,141 @@
+# Gráfico de evolución del fitness en vivo, dentro de la ventana. Cada generación solo
+# agrega un punto a unos arreglos; el dibujo lo hace un QTimer a lo más `max_fps` veces
+# por segundo, con blitting (se restaura el fondo guardado y se redibujan solo las
+# líneas) y con las series reducidas a `max_points` puntos, así que el costo de refrescar
+# no crece con el número de generaciones. matplotlib se importa al crear el widget.
+
+import numpy as np
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QVBoxLayout, QWidget
+
+# Serie del logbook, estilo, etiqueta y cómo se reduce un grupo de generaciones (None = promedio).
+SERIES = (
+    ('max', 'g-', 'Máximo', np.maximum),
+    ('avg', 'b-', 'Promedio', None),
+    ('min', 'r--', 'Mínimo', np.minimum),
+)
+
+def downsample(gens, values, max_points, reduce=None):
+    """
+    Reduce una serie a lo más `max_points` puntos juntando generaciones consecutivas.
+    Cada grupo aporta su primera generación y `reduce` de sus valores (np.maximum,
+    np.minimum o None para el promedio), así no se pierden los picos de las envolventes.
+    """
+    n = len(gens)
+    if n <= max_points:
+        return gens, values
+    starts = np.linspace(0, n, max_points, endpoint=False).astype(np.intp)
+    if reduce is None:
+        reduced = np.add.reduceat(values, starts) / np.diff(np.append(starts, n))
+    else:
+        reduced = reduce.reduceat(values, starts)
+    return gens[starts], reduced
+
+class LiveEvolutionChart(QWidget):
+    """
+    Widget con el máximo, promedio y mínimo del fitness por generación. append() se
+    llama con cada generación, clear() antes de una ejecución y finish() al terminar
+    para dibujar los últimos puntos.
+    """
+    def __init__(self, max_fps=10, max_points=1000, parent=None):
+        super().__init__(parent)
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+        from matplotlib.figure import Figure
+
+        self.max_points = max_points
+        self.figure = Figure(figsize=(5, 2.6), tight_layout=True)
+        self.canvas = FigureCanvasQTAgg(self.figure)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.canvas)
+        self.setMinimumHeight(220)
+
+        self.ax = self.figure.add_subplot()
+        self.ax.set_xlabel("Generación")
+        self.ax.set_ylabel("Fitness")
+        self.ax.grid(True, linestyle='--', alpha=0.6)
+        # animated=True: las líneas no entran en el dibujo completo, solo en el blit.
+        self.lines = [self.ax.plot([], [], style, label=label, animated=True)[0] for _, style, label, _ in SERIES]
+        self.ax.legend(loc='lower right', fontsize=8)
+
+        self._background = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self._timer = QTimer(self)
+        self._timer.setInterval(int(1000 / max_fps))
+        self._timer.timeout.connect(self.refresh)
+        self.clear()
+
+    def clear(self):
+        self._timer.stop()
+        self._gens = np.zeros(1024, dtype=np.int64)
+        self._values = np.zeros((len(SERIES), 1024))
+        self._count = 0
+        self._low = np.inf
+        self._high = -np.inf
+        self._fitted = False
+        self._dirty = False
+        for line in self.lines:
+            line.set_data([], [])
+        self.ax.set_xlim(0, 10)
+        self.ax.set_ylim(0, 1)
+        self.canvas.draw_idle()
+
+    def append(self, gen, stats):
+        if self._count == len(self._gens):
+            # Búferes que crecen al doble: agregar un punto cuesta O(1) amortizado.
+            self._gens = np.concatenate([self._gens, np.zeros_like(self._gens)])
+            self._values = np.concatenate([self._values, np.zeros_like(self._values)], axis=1)
+        self._gens[self._count] = gen
+        for row, (key, _, _, _) in enumerate(SERIES):
+            self._values[row, self._count] = stats[key]
+        self._low = min(self._low, stats['min'])
+        self._high = max(self._high, stats['max'])
+        self._count += 1
+        self._dirty = True
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def finish(self):
+        self._timer.stop()
+        self.refresh()
+
+    def refresh(self):
+        if not self._dirty:
+            # Sin puntos nuevos el temporizador se detiene hasta el siguiente append().
+            self._timer.stop()
+            return
+        self._dirty = False
+        gens = self._gens[:self._count]
+        for line, values, (_, _, _, reduce) in zip(self.lines, self._values, SERIES):
+            line.set_data(*downsample(gens, values[:self._count], self.max_points, reduce))
+        if self._rescale() or self._background is None:
+            # Cambiaron los ejes: dibujo completo (el draw_event guarda el nuevo fondo).
+            self.canvas.draw()
+        else:
+            self.canvas.restore_region(self._background)
+            self._draw_lines()
+            self.canvas.blit(self.ax.bbox)
+
+    def _rescale(self):
+        # Los límites crecen de a saltos (el eje x al doble), así que los dibujos
+        # completos son pocos aunque la ejecución tenga miles de generaciones.
+        changed = False
+        last_gen = self._gens[self._count - 1]
+        if last_gen > self.ax.get_xlim()[1]:
+            self.ax.set_xlim(0, 2 * last_gen)
+            changed = True
+        low, high = self.ax.get_ylim()
+        if not self._fitted or self._low < low or self._high > high:
+            margin = 0.1 * max(self._high - self._low, 0.01)
+            self.ax.set_ylim(self._low - margin, self._high + margin)
+            self._fitted = True
+            changed = True
+        return changed
+
+    def _draw_lines(self):
+        for line in self.lines:
+            self.ax.draw_artist(line)
+
+    def _on_draw(self, event):
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_lines()
@@ -1,140 +1,292 @@
-import matplotlib.pyplot as plt
+# Plano del aula con matplotlib. Los asientos se dibujan con unas pocas colecciones
+# (PatchCollection) en lugar de varios artistas por asiento, y los nombres solo se crean
+# para los asientos visibles cuando hay pocos en pantalla (nivel de detalle), así que un
+# aula de miles de asientos se dibuja rápido. export_layout() guarda el plano en PNG,
+# SVG o PDF sin pantalla ni pyplot, para el modo por lotes; ahí todos los nombres van
+# en unas pocas colecciones de trazos en lugar de uno o más artistas por asiento.
+# matplotlib se importa dentro de las funciones: importar este módulo no carga la
+# biblioteca de gráficos hasta que de verdad se abre o exporta un plano.
+
+import warnings
+
 import numpy as np
-from matplotlib.patches import Rectangle, FancyBboxPatch
-import matplotlib.patches as mpatches
 
-def plot_layout(seats, assignment, students, title="Distribución Optimizada de Asientos"):
-    
-    fig, ax = plt.subplots(figsize=(12, 8))
-    
+SEAT_SIZE = 0.8
+MARGIN = 0.1
+# Con más asientos visibles que esto solo se dibujan los colores, sin nombres.
+LABEL_LIMIT = 400
+
+# Categorías de visión: relleno, borde, símbolo y texto de la leyenda.
+NEAR, FAR, NORMAL = 0, 1, 2
+CATEGORIES = (
+    ('#ffcdd2', '#d32f2f', '👓', '👓 Necesita estar cerca (<= 4m)'),
+    ('#bbdefb', '#1976d2', '🔍', '🔍 Necesita estar lejos (> 4m)'),
+    ('#e8f5e8', '#388e3c', '👀', '👀 Visión Normal'),
+)
+EMPTY_COLOR = '#f5f5f5'
+
+def vision_category(dist_opt):
+    """Categoría de visión (NEAR, FAR o NORMAL) de una distancia óptima; índice de CATEGORIES."""
+    if dist_opt > 0 and dist_opt <= 4.0:
+        return NEAR
+    if dist_opt > 4.0:
+        return FAR
+    return NORMAL
+
+def _seat_geometry(seats, assignment):
+    # Esquina inferior izquierda de cada asiento y el estudiante que lo ocupa (-1 = vacío).
+    rows = np.array([row for row, _ in seats])
+    cols = np.array([col for _, col in seats])
+    occupant = np.full(len(seats), -1, dtype=np.intp)
+    occupant[np.asarray(assignment, dtype=np.intp)] = np.arange(len(assignment))
+    return cols - 1 + MARGIN, -(rows - 1) - 0.5, occupant
+
+def _draw_seats(ax, x, y, occupant, students):
+    from matplotlib.collections import PatchCollection
+    from matplotlib.patches import FancyBboxPatch, Rectangle
+
+    occupied = np.flatnonzero(occupant >= 0)
+    empty = np.flatnonzero(occupant < 0)
+    categories = [vision_category(students[occupant[k]].distancia_optima) for k in occupied]
+    # Con muchos asientos los bordes gruesos y las sombras solo ensucian el dibujo.
+    small = len(x) <= LABEL_LIMIT
+    linewidth = 2 if small else 0.5
+
+    if small:
+        ax.add_collection(PatchCollection(
+            [Rectangle((x[k] + 0.02, y[k] - 0.02), SEAT_SIZE, SEAT_SIZE) for k in occupied],
+            facecolor='gray', edgecolor='none', alpha=0.3))
+    ax.add_collection(PatchCollection(
+        [FancyBboxPatch((x[k], y[k]), SEAT_SIZE, SEAT_SIZE, boxstyle="round,pad=0.05") for k in occupied],
+        facecolor=[CATEGORIES[c][0] for c in categories], edgecolor=[CATEGORIES[c][1] for c in categories],
+        linewidth=linewidth))
+    ax.add_collection(PatchCollection(
+        [Rectangle((x[k], y[k]), SEAT_SIZE, SEAT_SIZE) for k in empty],
+        facecolor=EMPTY_COLOR, edgecolor='#ccc', linewidth=linewidth / 2, linestyle='--'))
+
+def _seat_texts(ax, x, y, occupant, students, k):
+    # Textos de un asiento (los mismos que tenía el plano original).
+    cx, cy = x[k] + SEAT_SIZE / 2, y[k] + SEAT_SIZE / 2
+    if occupant[k] < 0:
+        return [ax.text(cx, cy, '🪑\nVacío', ha='center', va='center', fontsize=8, color='#999', style='italic')]
+    student = students[occupant[k]]
+    dist_opt = student.distancia_optima
+    category = vision_category(dist_opt)
+    vision_text = 'Visión Normal' if category == NORMAL else f'D.Opt: {dist_opt}m'
+    return [
+        ax.text(cx, cy + 0.1, f"{CATEGORIES[category][2]}\n{student.name}", ha='center', va='center',
+                fontsize=9, fontweight='bold', color='black'),
+        ax.text(cx, cy - 0.2, vision_text, ha='center', va='center', fontsize=7, style='italic', color='#666'),
+    ]
+
+class _GlyphCache:
+    """
+    Trazos de cada carácter de una fuente (tamaño 1) y su avance,
+    para componer muchos textos en un solo Path sin pasar por TextPath en cada uno.
+    """
+    def __init__(self, prop):
+        from matplotlib.font_manager import findfont, get_font
+        from matplotlib.textpath import TextToPath
+        try:
+            from matplotlib.ft2font import LoadFlags
+            self._flags = LoadFlags.NO_HINTING
+        except ImportError:  # matplotlib < 3.10
+            from matplotlib.ft2font import LOAD_NO_HINTING
+            self._flags = LOAD_NO_HINTING
+
+        self._font = get_font(findfont(prop))
+        self._font.set_size(TextToPath.FONT_SCALE, TextToPath.DPI)
+        self._scale = 1 / TextToPath.FONT_SCALE
+        self._glyphs = {}
+
+    def glyph(self, char):
+        """(vértices, códigos, avance) del carácter; sin glifo en la fuente, un trazo vacío."""
+        if char not in self._glyphs:
+            vertices, codes = np.zeros((0, 2)), np.zeros(0, dtype=np.uint8)
+            advance = 0.0
+            if self._font.get_char_index(ord(char)):
+                glyph = self._font.load_char(ord(char), flags=self._flags)
+                advance = glyph.linearHoriAdvance / 65536 * self._scale
+                vertices, codes = self._font.get_path()
+                vertices = vertices * self._scale
+            self._glyphs[char] = (vertices, codes, advance)
+        return self._glyphs[char]
+
+def _text_paths(texts, size, max_width, glyphs):
+    """
+    Un Path por texto, centrado en el origen, en puntos: de tamaño `size` y reducido si
+    su ancho pasa de `max_width`.
+    """
+    from matplotlib.path import Path
+
+    paths = []
+    for text in texts:
+        chars = [glyphs.glyph(char) for char in text]
+        width = sum(advance for _, _, advance in chars)
+        scale = min(size, max_width / width) if width > 0 else size
+        # 0.35 de la altura: centro aproximado de las mayúsculas sobre la línea base.
+        pen_x, base_y = -width * scale / 2, -0.35 * scale
+        vertices, codes = [np.zeros((0, 2))], [np.zeros(0, dtype=np.uint8)]
+        for glyph_vertices, glyph_codes, advance in chars:
+            vertices.append(glyph_vertices * scale + (pen_x, base_y))
+            codes.append(glyph_codes)
+            pen_x += advance * scale
+        paths.append(Path(np.concatenate(vertices), np.concatenate(codes)))
+    return paths
+
+def _draw_label_paths(fig, ax, x, y, occupant, students):
+    """
+    Nombres de todos los asientos para un plano estático: los textos de cada estilo
+    (nombre, distancia óptima, asiento vacío) van en una PathCollection, así que el
+    plano tiene tres artistas de texto sin importar cuántos asientos haya. Los símbolos
+    de la visión no van: las fuentes comunes no traen esos emoji y el color ya la indica.
+    """
+    from matplotlib.collections import PathCollection
+    from matplotlib.font_manager import FontProperties
+    from matplotlib.transforms import Affine2D
+
+    cx, cy = x + SEAT_SIZE / 2, y + SEAT_SIZE / 2
+    occupied = np.flatnonzero(occupant >= 0)
+    empty = np.flatnonzero(occupant < 0)
+    seated = [students[occupant[k]] for k in occupied]
+    vision_texts = ['Visión Normal' if vision_category(student.distancia_optima) == NORMAL
+                    else f'D.Opt: {student.distancia_optima}m' for student in seated]
+    # Ancho de un asiento en puntos, para que ningún texto se salga de su caja.
+    x0, x1 = ax.get_xlim()
+    seat_points = SEAT_SIZE * ax.get_position().width * fig.get_figwidth() * 72 / (x1 - x0)
+    regular = _GlyphCache(FontProperties())
+    styles = (
+        ([student.name for student in seated], occupied, 0.1, 9, _GlyphCache(FontProperties(weight='bold')),
+         'black'),
+        (vision_texts, occupied, -0.2, 7, regular, '#666'),
+        (['Vacío'] * len(empty), empty, 0.0, 8, regular, '#999'),
+    )
+    # Los trazos están en puntos y cada texto se ubica en el centro de su asiento.
+    points = Affine2D().scale(1 / 72) + fig.dpi_scale_trans
+    for texts, seats, dy, size, glyphs, color in styles:
+        if len(seats) == 0:
+            continue
+        labels = PathCollection(_text_paths(texts, size, 0.9 * seat_points, glyphs),
+                                offsets=np.column_stack([cx[seats], cy[seats] + dy]),
+                                offset_transform=ax.transData, transform=points,
+                                facecolors=color, edgecolors='none')
+        # Fuera del ajuste 'tight' de savefig: los límites del plano ya están fijos.
+        labels.set_in_layout(False)
+        ax.add_collection(labels, autolim=False)
+
+def _attach_labels(ax, x, y, occupant, students, limit):
+    """
+    Nivel de detalle: cada vez que cambian los límites de los ejes (zoom o
+    desplazamiento) se muestran los textos de los asientos visibles si son a lo más
+    `limit`, y se ocultan si son más. Los textos se crean la primera vez que hacen falta.
+    """
+    centers_x, centers_y = x + SEAT_SIZE / 2, y + SEAT_SIZE / 2
+    created = {}
+
+    def update(_ax=None):
+        x0, x1 = sorted(ax.get_xlim())
+        y0, y1 = sorted(ax.get_ylim())
+        visible = np.flatnonzero((centers_x >= x0) & (centers_x <= x1) & (centers_y >= y0) & (centers_y <= y1))
+        wanted = set(visible.tolist()) if len(visible) <= limit else set()
+        for k, artists in created.items():
+            for artist in artists:
+                artist.set_visible(k in wanted)
+        for k in wanted - created.keys():
+            created[k] = _seat_texts(ax, x, y, occupant, students, k)
+
+    ax.callbacks.connect('xlim_changed', update)
+    ax.callbacks.connect('ylim_changed', update)
+    update()
+
+def draw_layout(fig, ax, seats, assignment, students, title="Distribución Optimizada de Asientos", labels=None):
+    """
+    Dibuja el plano en `ax`. `labels` controla los nombres: None los muestra según el
+    nivel de detalle (hasta LABEL_LIMIT asientos visibles), True todos (en trazos
+    agrupados, para planos estáticos) y False ninguno.
+    """
+    import matplotlib.patches as mpatches
+    from matplotlib.patches import FancyBboxPatch
+
     fig.patch.set_facecolor('#f8f9fa')
     ax.set_facecolor('#ffffff')
-    
+
     max_row = max(r for r, c in seats)
     max_col = max(c for r, c in seats)
-    
+
     board_width = max_col + 0.5
     board_height = 0.6
     board_x = 0.25
     board_y = 0.5
-    
-    shadow = FancyBboxPatch(
-        (board_x + 0.05, board_y - 0.05), board_width, board_height,
-        boxstyle="round,pad=0.1", facecolor='gray', alpha=0.3
-    )
-    ax.add_patch(shadow)
-    
-    board = FancyBboxPatch(
-        (board_x, board_y), board_width, board_height,
-        boxstyle="round,pad=0.1", facecolor='#2E7D32', edgecolor='#1B5E20', linewidth=2
-    )
-    ax.add_patch(board)
-    
-    ax.text(board_x + board_width/2, board_y + board_height/2, 
-            "📋 PIZARRÓN", ha='center', va='center', 
-            fontsize=14, fontweight='bold', color='white')
-    
-    student_by_seat = {}
-    for i, seat_idx in enumerate(assignment):
-        seat = seats[seat_idx]
-        student_by_seat[seat] = students[i]
-    
-    seat_size = 0.8
-    margin = 0.1
-    
-    for row in range(1, max_row + 1):
-        for col in range(1, max_col + 1):
-            seat_pos = (row, col)
-            
-            x = col - 1 + margin
-            y = -(row - 1) - 0.5
-            
-            if seat_pos in student_by_seat:
-                student = student_by_seat[seat_pos]
-                
-                # === INICIO DE LA MODIFICACIÓN: Lógica de visualización actualizada ===
-                dist_opt = student.distancia_optima
-                if dist_opt > 0 and dist_opt <= 4.0:
-                    color = '#ffcdd2'
-                    edge_color = '#d32f2f'
-                    symbol = '👓'
-                    vision_text = f'D.Opt: {dist_opt}m'
-                elif dist_opt > 4.0:
-                    color = '#bbdefb'
-                    edge_color = '#1976d2'
-                    symbol = '🔍'
-                    vision_text = f'D.Opt: {dist_opt}m'
-                else:
-                    color = '#e8f5e8'
-                    edge_color = '#388e3c'
-                    symbol = '👀'
-                    vision_text = 'Visión Normal'
-                # === FIN DE LA MODIFICACIÓN ===
-
-                shadow_chair = Rectangle((x + 0.02, y - 0.02), seat_size, seat_size, facecolor='gray', alpha=0.3)
-                ax.add_patch(shadow_chair)
-                
-                chair = FancyBboxPatch(
-                    (x, y), seat_size, seat_size,
-                    boxstyle="round,pad=0.05", 
-                    facecolor=color, edgecolor=edge_color, linewidth=2
-                )
-                ax.add_patch(chair)
-                
-                ax.text(x + seat_size/2, y + seat_size/2 + 0.1, 
-                       f"{symbol}\n{student.name}", 
-                       ha='center', va='center', 
-                       fontsize=9, fontweight='bold', color='black')
-                
-                ax.text(x + seat_size/2, y + seat_size/2 - 0.2, 
-                       vision_text, ha='center', va='center', 
-                       fontsize=7, style='italic', color='#666')
-                
-            else:
-                chair = Rectangle((x, y), seat_size, seat_size, 
-                                facecolor='#f5f5f5', edgecolor='#ccc', 
-                                linewidth=1, linestyle='--')
-                ax.add_patch(chair)
-                
-                ax.text(x + seat_size/2, y + seat_size/2, 
-                       '🪑\nVacío', ha='center', va='center', 
-                       fontsize=8, color='#999', style='italic')
-    
+    ax.add_patch(FancyBboxPatch((board_x + 0.05, board_y - 0.05), board_width, board_height,
+                                boxstyle="round,pad=0.1", facecolor='gray', alpha=0.3))
+    ax.add_patch(FancyBboxPatch((board_x, board_y), board_width, board_height,
+                                boxstyle="round,pad=0.1", facecolor='#2E7D32', edgecolor='#1B5E20', linewidth=2))
+    ax.text(board_x + board_width/2, board_y + board_height/2, "📋 PIZARRÓN",
+            ha='center', va='center', fontsize=14, fontweight='bold', color='white')
+
+    x, y, occupant = _seat_geometry(seats, assignment)
+    _draw_seats(ax, x, y, occupant, students)
+
     ax.set_xlim(-0.2, max_col + 0.3)
     ax.set_ylim(-max_row - 0.3, 1.5)
-    
-    ax.set_xticks(range(max_col + 1))
+    # En aulas grandes se rotula una de cada `step` filas y columnas.
+    step = max(1, int(np.ceil(max(max_row, max_col) / 40)))
+    ax.set_xticks(range(0, max_col + 1, step))
     ax.set_yticks([])
     ax.grid(True, alpha=0.1)
     ax.set_axisbelow(True)
-    
-    for col in range(1, max_col + 1):
-        ax.text(col - 1 + seat_size/2, -max_row - 0.15, f'Col {col}', 
-               ha='center', va='center', fontsize=10, fontweight='bold')
-    
-    for row in range(1, max_row + 1):
-        ax.text(-0.15, -(row - 1) - 0.5 + seat_size/2, f'F{row}', 
-               ha='center', va='center', fontsize=10, fontweight='bold', 
-               rotation=90)
-    
-    plt.title(title, fontsize=16, fontweight='bold', pad=20, color='#2E86AB')
-    
-    legend_elements = [
-        mpatches.Patch(color='#ffcdd2', label='👓 Necesita estar cerca (<= 4m)'),
-        mpatches.Patch(color='#bbdefb', label='🔍 Necesita estar lejos (> 4m)'),
-        mpatches.Patch(color='#e8f5e8', label='👀 Visión Normal'),
-        mpatches.Patch(color='#f5f5f5', label='🪑 Asiento vacío')
-    ]
-    
-    ax.legend(handles=legend_elements, loc='upper left', bbox_to_anchor=(1.02, 1), 
-             borderaxespad=0, frameon=True, fancybox=True, shadow=True)
-    
+    for col in range(1, max_col + 1, step):
+        ax.text(col - 1 + SEAT_SIZE/2, -max_row - 0.15, f'Col {col}',
+                ha='center', va='center', fontsize=10, fontweight='bold')
+    for row in range(1, max_row + 1, step):
+        ax.text(-0.15, -(row - 1) - 0.5 + SEAT_SIZE/2, f'F{row}',
+                ha='center', va='center', fontsize=10, fontweight='bold', rotation=90)
+
+    if labels:
+        _draw_label_paths(fig, ax, x, y, occupant, students)
+    elif labels is None:
+        _attach_labels(ax, x, y, occupant, students, LABEL_LIMIT)
+
+    ax.set_title(title, fontsize=16, fontweight='bold', pad=20, color='#2E86AB')
+    legend_elements = [mpatches.Patch(color=fill, label=label) for fill, _, _, label in CATEGORIES]
+    legend_elements.append(mpatches.Patch(color=EMPTY_COLOR, label='🪑 Asiento vacío'))
+    ax.legend(handles=legend_elements, loc='upper left', bbox_to_anchor=(1.02, 1),
+              borderaxespad=0, frameon=True, fancybox=True, shadow=True)
+
     info_text = f"Total estudiantes: {len(students)}\n"
     info_text += f"Asientos totales: {len(seats)}\n"
     info_text += f"Asientos libres: {len(seats) - len(students)}"
-
     ax.text(1.02, 0.4, info_text, transform=ax.transAxes, fontsize=10,
             verticalalignment='bottom', bbox=dict(boxstyle='round', facecolor='aliceblue'))
-    
-    plt.tight_layout(rect=[0, 0, 0.85, 1])
-    plt.show()
\ No newline at end of file
+
+def plot_layout(seats, assignment, students, title="Distribución Optimizada de Asientos"):
+    """Abre el plano en una ventana interactiva; al acercarse aparecen los nombres."""
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(12, 8))
+    draw_layout(fig, ax, seats, assignment, students, title)
+    fig.tight_layout(rect=[0, 0, 0.85, 1])
+    plt.show()
+
+def export_layout(path, seats, assignment, students, title="Distribución Optimizada de Asientos",
+                  dpi=150, labels=True):
+    """
+    Guarda el plano en `path` sin abrir ventanas (lienzo Agg, sin pyplot); el formato
+    sale de la extensión: .png, .svg o .pdf. El tamaño de la figura crece con el aula
+    para que el plano se pueda imprimir. `labels` como en draw_layout(); por defecto
+    True, porque en un archivo no hay zoom que haga aparecer los nombres.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    max_row = max(r for r, c in seats)
+    max_col = max(c for r, c in seats)
+    fig = Figure(figsize=(float(np.clip(0.9 * max_col + 4, 12, 60)), float(np.clip(0.9 * max_row + 2, 8, 60))))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    draw_layout(fig, ax, seats, assignment, students, title, labels)
+    with warnings.catch_warnings():
+        # Las fuentes por defecto no traen los emoji de los símbolos; en un lote sin
+        # pantalla los avisos por cada glifo solo llenarían la salida.
+        warnings.filterwarnings('ignore', message='Glyph .* missing from')
+        fig.savefig(path, dpi=dpi, bbox_inches='tight', facecolor=fig.get_facecolor())
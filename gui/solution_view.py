@@ -0,0 +1,181 @@
+# Vistas de una solución para SolutionDialog que no crean un widget por estudiante:
+# un modelo de tabla (QAbstractTableModel) que da formato a cada celda solo cuando la
+# vista la pide y un plano de asientos que se pinta a mano, solo en la parte visible.
+# Las métricas se calculan de una vez con NumPy a partir del ProblemInstance.
+
+import numpy as np
+from PySide6.QtCore import QAbstractTableModel, QEvent, QRectF, QSize, Qt
+from PySide6.QtGui import QColor, QPainter, QPen
+from PySide6.QtWidgets import QToolTip, QWidget
+
+from gui.plot import CATEGORIES, vision_category
+
+def solution_metrics(instance, solution):
+    """
+    Métricas por estudiante de una asignación, como arreglos: fila y columna del asiento,
+    distancia real, distancia óptima (0 = visión normal), error de visión y distancia
+    euclídea promedio a sus compañeros incompatibles (-1 si no tiene).
+    """
+    layout = instance.layout
+    seats = np.asarray(solution, dtype=np.intp)
+    n = instance.num_students
+    rows, cols = layout.seat_rows[seats], layout.seat_cols[seats]
+    # Cada pareja incompatible suma su distancia a los dos estudiantes.
+    ci, cj = instance.conflict_i, instance.conflict_j
+    distance = np.hypot(rows[ci] - rows[cj], cols[ci] - cols[cj])
+    totals = np.bincount(ci, distance, minlength=n) + np.bincount(cj, distance, minlength=n)
+    counts = np.bincount(ci, minlength=n) + np.bincount(cj, minlength=n)
+    avg_incompatible = np.full(n, -1.0)
+    np.divide(totals, counts, out=avg_incompatible, where=counts > 0)
+    return {
+        'row': rows,
+        'col': cols,
+        'dist_real': layout.seat_dists[seats],
+        'dist_opt': instance.optimas,
+        'error_vision': instance.vision(np.arange(n), seats),
+        'avg_incompatible': avg_incompatible,
+    }
+
+class StudentMetricsModel(QAbstractTableModel):
+    """Tabla de métricas por estudiante; el texto de cada celda se arma al pintarla."""
+    HEADERS = ["Estudiante", "Asiento (F, C)", "Distancia Real", "Distancia Óptima", "Error Visión",
+               "Dist. a Incompatibles"]
+
+    def __init__(self, students, metrics, parent=None):
+        super().__init__(parent)
+        self.students = students
+        self.metrics = metrics
+
+    def rowCount(self, parent=None):
+        return len(self.students)
+
+    def columnCount(self, parent=None):
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        i, column = index.row(), index.column()
+        metrics = self.metrics
+        if column == 0:
+            return self.students[i].name
+        if column == 1:
+            return f"F{metrics['row'][i]}, C{metrics['col'][i]}"
+        if column == 2:
+            return f"{metrics['dist_real'][i]:.2f} m"
+        if column == 3:
+            return f"{metrics['dist_opt'][i]:.2f} m" if metrics['dist_opt'][i] > 0 else "N/A"
+        if column == 4:
+            return f"{metrics['error_vision'][i]:.2f} m"
+        avg = metrics['avg_incompatible'][i]
+        return f"{avg:.2f}" if avg != -1 else "N/A"
+
+class SeatGridWidget(QWidget):
+    """
+    Plano de asientos pintado con QPainter. Va dentro de un QScrollArea y en cada
+    paintEvent solo se dibujan las celdas del rectángulo expuesto, así que el costo
+    depende de lo que se ve y no del tamaño del aula. El tooltip muestra el detalle.
+    """
+    CELL_WIDTH = 90
+    CELL_HEIGHT = 48
+    GAP = 5
+    BOARD_HEIGHT = 34
+
+    def __init__(self, students, seats, solution, parent=None):
+        super().__init__(parent)
+        self.students = students
+        self.seats = seats
+        self.max_row = max(seat[0] for seat in seats)
+        self.max_col = max(seat[1] for seat in seats)
+        # Estudiante en cada celda (fila, columna) del aula; -1 = asiento vacío, -2 = sin asiento.
+        self.grid = np.full((self.max_row + 1, self.max_col + 1), -2, dtype=np.intp)
+        for row, col in seats:
+            self.grid[row, col] = -1
+        for i, seat_idx in enumerate(solution):
+            row, col = seats[seat_idx]
+            self.grid[row, col] = i
+        self.setFixedSize(self.sizeHint())
+        self.setMouseTracking(True)
+
+    def sizeHint(self):
+        return QSize(self.max_col * (self.CELL_WIDTH + self.GAP) + self.GAP,
+                     self.BOARD_HEIGHT + self.max_row * (self.CELL_HEIGHT + self.GAP) + self.GAP)
+
+    def _cell_rect(self, row, col):
+        return QRectF(self.GAP + (col - 1) * (self.CELL_WIDTH + self.GAP),
+                      self.BOARD_HEIGHT + self.GAP + (row - 1) * (self.CELL_HEIGHT + self.GAP),
+                      self.CELL_WIDTH, self.CELL_HEIGHT)
+
+    def _cell_at(self, x, y):
+        col = int((x - self.GAP) // (self.CELL_WIDTH + self.GAP)) + 1
+        row = int((y - self.BOARD_HEIGHT - self.GAP) // (self.CELL_HEIGHT + self.GAP)) + 1
+        if 1 <= row <= self.max_row and 1 <= col <= self.max_col:
+            return row, col
+        return None
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        exposed = event.rect()
+        font = painter.font()
+        font.setPointSize(8)
+        painter.setFont(font)
+
+        if exposed.top() < self.BOARD_HEIGHT:
+            board = QRectF(self.GAP, 2, self.width() - 2 * self.GAP, self.BOARD_HEIGHT - 4)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor("#2E7D32"))
+            painter.drawRoundedRect(board, 4, 4)
+            painter.setPen(QColor("white"))
+            painter.drawText(board, Qt.AlignCenter, "📋 PIZARRÓN")
+
+        # Solo las filas y columnas que caen en el rectángulo expuesto.
+        step_x, step_y = self.CELL_WIDTH + self.GAP, self.CELL_HEIGHT + self.GAP
+        first_col = max(1, (exposed.left() - self.GAP) // step_x + 1)
+        last_col = min(self.max_col, (exposed.right() - self.GAP) // step_x + 1)
+        first_row = max(1, (exposed.top() - self.BOARD_HEIGHT - self.GAP) // step_y + 1)
+        last_row = min(self.max_row, (exposed.bottom() - self.BOARD_HEIGHT - self.GAP) // step_y + 1)
+        empty_pen = QPen(QColor("#cccccc"), 1, Qt.DashLine)
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                occupant = self.grid[row, col]
+                if occupant == -2:
+                    continue
+                rect = self._cell_rect(row, col)
+                if occupant == -1:
+                    painter.setPen(empty_pen)
+                    painter.setBrush(QColor("#fafafa"))
+                    painter.drawRoundedRect(rect, 4, 4)
+                    painter.setPen(QColor("#999999"))
+                    painter.drawText(rect, Qt.AlignCenter, "🪑\nVacío")
+                    continue
+                student = self.students[occupant]
+                # Mismos colores y símbolos que el plano de matplotlib (gui.plot).
+                fill, border, icon, _ = CATEGORIES[vision_category(student.distancia_optima)]
+                painter.setPen(QPen(QColor(border), 1))
+                painter.setBrush(QColor(fill))
+                painter.drawRoundedRect(rect, 4, 4)
+                painter.setPen(QColor("black"))
+                name = painter.fontMetrics().elidedText(student.name, Qt.ElideRight, self.CELL_WIDTH - 6)
+                painter.drawText(rect, Qt.AlignCenter, f"{icon}\n{name}")
+        painter.end()
+
+    def event(self, event):
+        if event.type() == QEvent.ToolTip:
+            cell = self._cell_at(event.pos().x(), event.pos().y())
+            occupant = self.grid[cell] if cell is not None else -2
+            if occupant >= 0:
+                student = self.students[occupant]
+                vision = f"{student.distancia_optima} m" if student.distancia_optima > 0 else "Visión Normal"
+                QToolTip.showText(event.globalPos(), f"{student.name}\nF{cell[0]}, C{cell[1]} · {vision}", self)
+            elif occupant == -1:
+                QToolTip.showText(event.globalPos(), f"Asiento vacío F{cell[0]}, C{cell[1]}", self)
+            else:
+                QToolTip.hideText()
+            return True
+        return super().event(event)
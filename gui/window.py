@@ -3,32 +3,35 @@ from PySide6.QtWidgets import (
     QSpinBox, QLineEdit, QListWidget, QComboBox, QMessageBox,
     QDialog, QCheckBox, QDialogButtonBox, QDoubleSpinBox,
     QTabWidget, QScrollArea, QGridLayout, QFrame, QGroupBox,
-    QTableWidget, QTableWidgetItem, QTextEdit
+    QTableView, QTextEdit, QProgressBar
 )
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt
 from core.models import Student
+from core.datasets import load_dataset, compatibility_matrix
 # === INICIO DE LA MODIFICACIÓN: Importar todas las funciones necesarias explícitamente ===
-from core.genetic import run_ga, evaluate, penalizacion_vision, penalizacion_compatibilidad, penalizacion_asientos_vacios
+from core.genetic import solve, reoptimize
+from core.instance import ProblemInstance, build_room
 # === FIN DE LA MODIFICACIÓN ===
 from gui.plot import plot_layout
-from gui.evolution_plot import plot_evolution
+from gui.live_chart import LiveEvolutionChart
+from gui.solution_view import SeatGridWidget, StudentMetricsModel, solution_metrics
+from gui.worker import GAWorker
 import numpy as np
 import sys
-import io
 import os
-import csv
-import math
 
 class SolutionDialog(QDialog):
     
-    def __init__(self, solutions, students, seats, seat_distances, compatibility_matrix, parent=None):
+    def __init__(self, solutions, students, seats, seat_distances, compatibility_matrix, parent=None, instance=None):
         super().__init__(parent)
         self.solutions = solutions
         self.students = students
         self.seats = seats
         self.seat_distances = seat_distances
         self.compatibility_matrix = compatibility_matrix
+        if instance is None:
+            instance = ProblemInstance(students, seats, compatibility_matrix, seat_distances)
+        self.instance = instance
         
         self.setWindowTitle("Mejores Soluciones Encontradas")
         self.setMinimumSize(900, 700)
@@ -42,11 +45,16 @@ class SolutionDialog(QDialog):
         title.setStyleSheet("font-size: 16px; font-weight: bold; padding: 10px; color: #2E86AB;")
         layout.addWidget(title)
         
+        # Las pestañas se construyen la primera vez que se seleccionan; al abrir solo la primera.
         self.tab_widget = QTabWidget()
-        for i, solution in enumerate(self.solutions):
-            tab = self.create_solution_tab(solution, i + 1)
-            self.tab_widget.addTab(tab, f"Solución {i + 1}")
+        self.built_tabs = set()
+        for i in range(len(self.solutions)):
+            page = QWidget()
+            QVBoxLayout(page).setContentsMargins(0, 0, 0, 0)
+            self.tab_widget.addTab(page, f"Solución {i + 1}")
+        self.tab_widget.currentChanged.connect(self.ensure_tab)
         layout.addWidget(self.tab_widget)
+        self.ensure_tab(0)
         
         button_layout = QHBoxLayout()
         plot_button = QPushButton("📊 Ver Plano Visual")
@@ -57,6 +65,12 @@ class SolutionDialog(QDialog):
         close_button.clicked.connect(self.accept)
         button_layout.addWidget(close_button)
         layout.addLayout(button_layout)
+
+    def ensure_tab(self, index):
+        if index < 0 or index >= len(self.solutions) or index in self.built_tabs:
+            return
+        self.built_tabs.add(index)
+        self.tab_widget.widget(index).layout().addWidget(self.create_solution_tab(self.solutions[index], index + 1))
     
     def create_solution_tab(self, solution, solution_num):
         scroll = QScrollArea()
@@ -64,83 +78,23 @@ class SolutionDialog(QDialog):
         main_widget = QWidget()
         layout = QVBoxLayout(main_widget)
 
-        # --- Parte 1: Plano Visual de Asientos ---
+        # --- Parte 1: Plano Visual de Asientos (pintado a mano, solo la parte visible) ---
         assignment_frame = QGroupBox("🪑 Asignación de Asientos")
         assignment_layout = QVBoxLayout(assignment_frame)
-        
-        grid_layout = QGridLayout()
-        grid_layout.setSpacing(5)
-        students_by_seat = {self.seats[seat_idx]: self.students[i] for i, seat_idx in enumerate(solution)}
-        max_row = max(seat[0] for seat in self.seats)
-        max_col = max(seat[1] for seat in self.seats)
-        
-        board_label = QLabel("📋 PIZARRÓN")
-        board_label.setAlignment(Qt.AlignCenter)
-        board_label.setStyleSheet("background-color: #2E7D32; color: white; padding: 8px; font-weight: bold; border-radius: 4px;")
-        grid_layout.addWidget(board_label, 0, 0, 1, max_col)
-        
-        for row in range(1, max_row + 1):
-            for col in range(1, max_col + 1):
-                seat_pos = (row, col)
-                student = students_by_seat.get(seat_pos)
-                if student:
-                    dist_opt = student.distancia_optima
-                    if dist_opt > 0 and dist_opt <= 4.0: bg_color, icon, border_color = "#ffcdd2", "👓", "#d32f2f"
-                    elif dist_opt > 4.0: bg_color, icon, border_color = "#bbdefb", "🔍", "#1976d2"
-                    else: bg_color, icon, border_color = "#e8f5e9", "👀", "#388e3c"
-                    seat_label = QLabel(f"{icon}\n{student.name}")
-                    seat_label.setStyleSheet(f"background-color: {bg_color}; border: 1px solid {border_color}; border-radius: 4px; padding: 5px; font-size: 10px; min-width: 80px; min-height: 40px;")
-                else:
-                    seat_label = QLabel("🪑\nVacío")
-                    seat_label.setStyleSheet("background-color: #fafafa; border: 1px dashed #ccc; border-radius: 4px; padding: 5px; font-size: 10px; color: #999; min-width: 80px; min-height: 40px;")
-                seat_label.setAlignment(Qt.AlignCenter)
-                grid_layout.addWidget(seat_label, row, col - 1)
-        
-        assignment_layout.addLayout(grid_layout)
+        grid_scroll = QScrollArea()
+        grid_scroll.setWidget(SeatGridWidget(self.students, self.seats, solution))
+        grid_scroll.setMinimumHeight(260)
+        assignment_layout.addWidget(grid_scroll)
         layout.addWidget(assignment_frame)
 
         # --- Parte 2: Desglose y Análisis Detallado ---
         analysis_frame = QGroupBox("📊 Análisis Detallado de la Solución")
         analysis_layout = QVBoxLayout(analysis_frame)
 
-        # 2.1 Tabla de Métricas por Estudiante
-        table = QTableWidget()
-        table.setColumnCount(6)
-        table.setHorizontalHeaderLabels(["Estudiante", "Asiento (F, C)", "Distancia Real", "Distancia Óptima", "Error Visión", "Dist. a Incompatibles"])
-        table.setRowCount(len(self.students))
-
-        student_metrics = {}
-        for i, seat_idx in enumerate(solution):
-            student = self.students[i]
-            seat_pos = self.seats[seat_idx]
-            dist_real = self.seat_distances[seat_pos]
-            dist_opt = student.distancia_optima
-            error_vision = abs(dist_real - dist_opt) if dist_opt > 0 else 0.0
-            
-            incompatible_distances = []
-            for j in range(len(self.students)):
-                if self.compatibility_matrix[i][j] == 1:
-                    other_seat_idx = solution[j]
-                    other_seat_pos = self.seats[other_seat_idx]
-                    dist_euc = math.sqrt((seat_pos[0] - other_seat_pos[0])**2 + (seat_pos[1] - other_seat_pos[1])**2)
-                    incompatible_distances.append(dist_euc)
-            
-            avg_dist_incompatible = np.mean(incompatible_distances) if incompatible_distances else -1
-            student_metrics[student.name] = {
-                'seat': f"F{seat_pos[0]}, C{seat_pos[1]}",
-                'error_vision': error_vision,
-                'avg_dist_incompatible': avg_dist_incompatible,
-                'dist_opt': dist_opt
-            }
-
-            table.setItem(i, 0, QTableWidgetItem(student.name))
-            table.setItem(i, 1, QTableWidgetItem(f"F{seat_pos[0]}, C{seat_pos[1]}"))
-            table.setItem(i, 2, QTableWidgetItem(f"{dist_real:.2f} m"))
-            table.setItem(i, 3, QTableWidgetItem(f"{dist_opt:.2f} m" if dist_opt > 0 else "N/A"))
-            table.setItem(i, 4, QTableWidgetItem(f"{error_vision:.2f} m"))
-            dist_incomp_str = f"{avg_dist_incompatible:.2f}" if avg_dist_incompatible != -1 else "N/A"
-            table.setItem(i, 5, QTableWidgetItem(dist_incomp_str))
-
+        # 2.1 Tabla de Métricas por Estudiante (modelo/vista: sin un ítem por celda)
+        metrics = solution_metrics(self.instance, solution)
+        table = QTableView()
+        table.setModel(StudentMetricsModel(self.students, metrics, table))
         table.resizeColumnsToContents()
         table.setFixedHeight(300)
         analysis_layout.addWidget(table)
@@ -149,25 +103,28 @@ class SolutionDialog(QDialog):
         report_text = QTextEdit()
         report_text.setReadOnly(True)
         
-        temp_individual = type('Individual', (object,), {'chromosome': solution})()
-        fitness_score = evaluate(temp_individual, self.students, self.seats, self.compatibility_matrix, self.seat_distances, max(self.seat_distances.values()))
+        fitness_score = self.instance.evaluate(solution)
         
         report_html = f"<h3>Reporte de la Solución</h3>"
         report_html += f"<p><b>Puntuación de Fitness Final: {fitness_score:.4f}</b> (un valor más cercano a 0 es mejor).</p>"
         report_html += "<ul>"
         
-        for name, metrics in sorted(student_metrics.items()):
-            if metrics['dist_opt'] > 0:
-                if metrics['error_vision'] < 0.5:
-                    report_html += f"<li><b>{name}</b> ({metrics['seat']}) está <b>excelentemente ubicado</b> para su visión (error de solo {metrics['error_vision']:.2f} m).</li>"
-                elif metrics['error_vision'] < 1.5:
-                     report_html += f"<li><b>{name}</b> ({metrics['seat']}) tiene una <b>buena ubicación</b> para su visión (error de {metrics['error_vision']:.2f} m).</li>"
-
-            if metrics['avg_dist_incompatible'] != -1:
-                if metrics['avg_dist_incompatible'] > 2.0:
-                    report_html += f"<li><b>{name}</b> ({metrics['seat']}) está <b>bien separado</b> de sus compañeros incompatibles (distancia promedio {metrics['avg_dist_incompatible']:.2f}).</li>"
+        for i in sorted(range(len(self.students)), key=lambda i: self.students[i].name):
+            name = self.students[i].name
+            seat = f"F{metrics['row'][i]}, C{metrics['col'][i]}"
+            error_vision = metrics['error_vision'][i]
+            avg_dist_incompatible = metrics['avg_incompatible'][i]
+            if metrics['dist_opt'][i] > 0:
+                if error_vision < 0.5:
+                    report_html += f"<li><b>{name}</b> ({seat}) está <b>excelentemente ubicado</b> para su visión (error de solo {error_vision:.2f} m).</li>"
+                elif error_vision < 1.5:
+                     report_html += f"<li><b>{name}</b> ({seat}) tiene una <b>buena ubicación</b> para su visión (error de {error_vision:.2f} m).</li>"
+
+            if avg_dist_incompatible != -1:
+                if avg_dist_incompatible > 2.0:
+                    report_html += f"<li><b>{name}</b> ({seat}) está <b>bien separado</b> de sus compañeros incompatibles (distancia promedio {avg_dist_incompatible:.2f}).</li>"
                 else:
-                    report_html += f"<li><font color='orange'>Advertencia:</font> <b>{name}</b> ({metrics['seat']}) está <b>cerca</b> de uno o más compañeros incompatibles. Esto puede ser un compromiso necesario para optimizar otros factores.</li>"
+                    report_html += f"<li><font color='orange'>Advertencia:</font> <b>{name}</b> ({seat}) está <b>cerca</b> de uno o más compañeros incompatibles. Esto puede ser un compromiso necesario para optimizar otros factores.</li>"
 
         report_html += "</ul>"
         report_text.setHtml(report_html)
@@ -194,6 +151,10 @@ class SeatPlanApp:
         self.window.setMinimumSize(550, 700)
         self.students = []
         self.compat_matrix = None
+        # Última solución (nombres, asignación y aula) para el arranque en caliente.
+        self.last_run = None
+        self.worker = None
+        self.live_chart = None
         self.setup_styles()
         self.setup_ui()
 
@@ -225,10 +186,26 @@ class SeatPlanApp:
         self.aula_input = QComboBox()
         self.aula_input.addItems([
             "5 Filas x 6 Columnas (30 asientos)",
-            "8 Filas x 5 Columnas (40 asientos)"
+            "8 Filas x 5 Columnas (40 asientos)",
+            "Personalizado"
         ])
         aula_config_layout.addWidget(self.aula_input)
         aula_layout.addLayout(aula_config_layout)
+
+        custom_layout = QHBoxLayout()
+        custom_layout.addWidget(QLabel("Filas:"))
+        self.rows_input = QSpinBox()
+        self.rows_input.setRange(1, 200)
+        self.rows_input.setValue(40)
+        custom_layout.addWidget(self.rows_input)
+        custom_layout.addWidget(QLabel("Columnas:"))
+        self.cols_input = QSpinBox()
+        self.cols_input.setRange(1, 200)
+        self.cols_input.setValue(50)
+        custom_layout.addWidget(self.cols_input)
+        aula_layout.addLayout(custom_layout)
+        self.aula_input.currentIndexChanged.connect(self.update_room_inputs)
+        self.update_room_inputs()
         content_layout.addWidget(aula_box)
 
         students_box, students_layout = self._create_group_box("👥 Gestión de Estudiantes")
@@ -283,11 +260,19 @@ class SeatPlanApp:
         compat_layout.addWidget(self.compat_status)
         content_layout.addWidget(compat_box)
 
-        optim_box, optim_layout = self._create_group_box("🚀 Optimización")
+        optim_box, self.optim_layout = self._create_group_box("🚀 Optimización")
+        optim_layout = self.optim_layout
         self.run_button = QPushButton("🧬 Ejecutar Algoritmo Genético")
         self.run_button.setObjectName("runButton")
         self.run_button.clicked.connect(self.optimize_seats)
         optim_layout.addWidget(self.run_button)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        optim_layout.addWidget(self.progress_bar)
+        self.cancel_button = QPushButton("⏹️ Cancelar")
+        self.cancel_button.clicked.connect(self.cancel_optimization)
+        self.cancel_button.setVisible(False)
+        optim_layout.addWidget(self.cancel_button)
         self.progress_label = QLabel("")
         self.progress_label.setAlignment(Qt.AlignCenter)
         optim_layout.addWidget(self.progress_label)
@@ -369,6 +354,23 @@ class SeatPlanApp:
     def run(self):
         self.window.show()
         self.app.exec()
+        # Si se cierra la ventana a mitad de una ejecución, se cancela y se espera al hilo.
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker.wait()
+
+    def update_room_inputs(self):
+        custom = self.aula_input.currentIndex() == 2
+        self.rows_input.setEnabled(custom)
+        self.cols_input.setEnabled(custom)
+
+    def room_size(self):
+        selected_index = self.aula_input.currentIndex()
+        if selected_index == 0:
+            return 5, 6
+        if selected_index == 1:
+            return 8, 5
+        return self.rows_input.value(), self.cols_input.value()
 
     def add_student(self):
         name = self.name_input.text().strip()
@@ -393,9 +395,10 @@ class SeatPlanApp:
         self.students_list.addItem(display_text)
         self.name_input.clear()
         self.name_input.setFocus()
-        self.compat_matrix = None
-        self.compat_status.setText("❌ Compatibilidades no definidas")
-        self.compat_status.setStyleSheet("color: #d32f2f; font-weight: bold;")
+        if self.compat_matrix is not None:
+            # El nuevo estudiante entra sin conflictos; se conservan los ya definidos.
+            self.compat_matrix = np.pad(self.compat_matrix, ((0, 1), (0, 1)))
+            self.update_compat_status()
 
     def remove_student(self):
         current_row = self.students_list.currentRow()
@@ -411,9 +414,14 @@ class SeatPlanApp:
                 else:
                     vision_text = f"🎯 Dist. Óptima: {distancia_optima} m"
                 self.students_list.item(i).setText(f"[ID: {i}] {vision_text} - {student.name}")
-            self.compat_matrix = None
-            self.compat_status.setText("❌ Compatibilidades no definidas")
-            self.compat_status.setStyleSheet("color: #d32f2f; font-weight: bold;")
+            if self.compat_matrix is not None:
+                self.compat_matrix = np.delete(np.delete(self.compat_matrix, current_row, axis=0), current_row, axis=1)
+                self.update_compat_status()
+
+    def update_compat_status(self):
+        conflict_pairs = int(np.count_nonzero(np.triu(self.compat_matrix, 1)))
+        self.compat_status.setText(f"✅ {conflict_pairs} parejas conflictivas definidas")
+        self.compat_status.setStyleSheet("color: #2E7D32; font-weight: bold;")
 
     def clear_students(self, ask_confirmation=False):
         if ask_confirmation:
@@ -425,6 +433,7 @@ class SeatPlanApp:
         self.students.clear()
         self.students_list.clear()
         self.compat_matrix = None
+        self.last_run = None
         self.compat_status.setText("❌ Compatibilidades no definidas")
         self.compat_status.setStyleSheet("color: #d32f2f; font-weight: bold;")
     
@@ -442,40 +451,22 @@ class SeatPlanApp:
             students_file = os.path.join(base_dir, 'datasets', 'students_dataset.csv')
             compat_file = os.path.join(base_dir, 'datasets', 'compatibility_dataset.csv')
             
-            id_from_file_to_index = {}
-            with open(students_file, mode='r', encoding='utf-8') as infile:
-                reader = csv.DictReader(infile)
-                for row in reader:
-                    file_id = row['id'].strip()
-                    name = row['name'].strip()
-                    distancia_optima = float(row['distancia_optima'].strip())
-                    
-                    student_index = len(self.students)
-                    self.students.append(Student(name, distancia_optima, student_index))
-                    id_from_file_to_index[file_id] = student_index
-                    
-                    if distancia_optima == 0:
-                        vision_text = "👀 Visión Normal"
-                    else:
-                        vision_text = f"🎯 Dist. Óptima: {distancia_optima} m"
-                    display_text = f"[ID: {student_index}] {vision_text} - {name}"
-                    self.students_list.addItem(display_text)
+            students, _, pairs = load_dataset(students_file, compat_file)
+            for student in students:
+                student_index = len(self.students)
+                student.index = student_index
+                self.students.append(student)
+
+                if student.distancia_optima == 0:
+                    vision_text = "👀 Visión Normal"
+                else:
+                    vision_text = f"🎯 Dist. Óptima: {student.distancia_optima} m"
+                display_text = f"[ID: {student_index}] {vision_text} - {student.name}"
+                self.students_list.addItem(display_text)
 
             num_students = len(self.students)
-            self.compat_matrix = np.zeros((num_students, num_students))
-            compat_pairs_count = 0
-            with open(compat_file, mode='r', encoding='utf-8') as infile:
-                reader = csv.DictReader(infile)
-                for row in reader:
-                    s1_id = row['student1_id'].strip()
-                    s2_id = row['student2_id'].strip()
-                    
-                    if s1_id in id_from_file_to_index and s2_id in id_from_file_to_index:
-                        idx1 = id_from_file_to_index[s1_id]
-                        idx2 = id_from_file_to_index[s2_id]
-                        self.compat_matrix[idx1, idx2] = 1
-                        self.compat_matrix[idx2, idx1] = 1
-                        compat_pairs_count += 1
+            self.compat_matrix = compatibility_matrix(num_students, pairs)
+            compat_pairs_count = len(pairs)
             
             self.aula_input.setCurrentIndex(0)
             
@@ -540,12 +531,8 @@ class SeatPlanApp:
             QMessageBox.warning(self.window, "Error", "No hay estudiantes agregados en la lista.")
             return
 
-        selected_index = self.aula_input.currentIndex()
-        if selected_index == 0:
-            rows, cols = 5, 6
-        else:
-            rows, cols = 8, 5
-        
+        rows, cols = self.room_size()
+
         distancia_inicial = 2.0
         distancia_entre_filas = 1.0
 
@@ -554,8 +541,7 @@ class SeatPlanApp:
             QMessageBox.critical(self.window, "Error de Capacidad", f"El aula seleccionada ({total_seats} asientos) no tiene suficientes lugares para los {len(self.students)} estudiantes.")
             return
             
-        seats = [(r + 1, c + 1) for r in range(rows) for c in range(cols)]
-        seat_distances = { (r + 1, c + 1): distancia_inicial + (r * distancia_entre_filas) for r in range(rows) for c in range(cols) }
+        seats, seat_distances = build_room(rows, cols, distancia_inicial, distancia_entre_filas)
 
         if self.compat_matrix is None:
             reply = QMessageBox.question(self.window, "Aviso de Compatibilidad", 
@@ -565,27 +551,77 @@ class SeatPlanApp:
                 return
             self.compat_matrix = np.zeros((len(self.students), len(self.students)))
 
-        self.progress_label.setText("🔄 Ejecutando algoritmo genético, por favor espera...")
-        self.run_button.setEnabled(False)
-        self.app.processEvents()
-
-        old_stdout = sys.stdout
-        sys.stdout = captured_output = io.StringIO()
-        
-        solutions = None
-        logbook = None
+        # El algoritmo corre en un hilo aparte (gui.worker); la ventana sigue respondiendo.
+        # Se trabaja con una copia de la lista por si se edita mientras tanto.
+        ngen = 150
+        students = list(self.students)
+        compat = self.compat_matrix
+        instance = ProblemInstance(students, seats, compat, seat_distances)
+        names = [student.name for student in students]
+        if self.last_run is not None and self.last_run['room'] == (rows, cols) and self.last_run['names'] != names:
+            # Arranque en caliente: se parte de la solución anterior y solo se reacomoda lo que cambió
+            # en la lista. Con la misma lista (otra vez "optimizar") se hace una ejecución nueva.
+            self.worker = GAWorker(reoptimize, self.last_run['names'], self.last_run['assignment'], students,
+                                   seats, compat, seat_distances, [1], ngen=ngen, instance=instance, verbose=False,
+                                   previous_conflicts=self.last_run['conflicts'])
+        else:
+            self.worker = GAWorker(solve, students, seats, compat, seat_distances, [1],
+                                   ngen=ngen, instance=instance, verbose=False)
+        self.worker.progress.connect(self.show_progress)
+        self.worker.succeeded.connect(
+            lambda result: self.show_results(result, students, compat, seats, seat_distances, instance, (rows, cols)))
+        self.worker.failed.connect(self.show_error)
+        self.worker.finished.connect(self.optimization_finished)
 
-        try:
-            solutions, logbook = run_ga(self.students, seats, self.compat_matrix, seat_distances, [1])
-        finally:
-            sys.stdout = old_stdout
-            print(captured_output.getvalue())
-            self.run_button.setEnabled(True)
+        self.run_button.setEnabled(False)
+        self.cancel_button.setEnabled(True)
+        self.cancel_button.setVisible(True)
+        self.progress_bar.setRange(0, ngen)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        self.progress_label.setText("🔄 Ejecutando algoritmo genético...")
+        if self.live_chart is None:
+            # El gráfico (y matplotlib) se crea con la primera ejecución, no al abrir la ventana.
+            self.live_chart = LiveEvolutionChart()
+            self.optim_layout.addWidget(self.live_chart)
+        self.live_chart.clear()
+        self.worker.start()
+
+    def show_progress(self, event):
+        self.live_chart.append(event.gen, event.stats)
+        self.progress_bar.setValue(event.gen)
+        self.progress_label.setText(f"🔄 Generación {event.gen} · mejor fitness {event.best_fitness:.4f}")
+
+    def cancel_optimization(self):
+        if self.worker is not None:
+            self.worker.cancel()
+            self.cancel_button.setEnabled(False)
+            self.progress_label.setText("⏳ Cancelando, se conservará la mejor solución hasta ahora...")
+
+    def optimization_finished(self):
+        self.worker = None
+        self.live_chart.finish()
+        self.run_button.setEnabled(True)
+        self.cancel_button.setVisible(False)
+        self.progress_bar.setVisible(False)
+
+    def show_error(self, message):
+        self.progress_label.setText("❌ La optimización falló")
+        QMessageBox.critical(self.window, "Error", f"Ocurrió un error durante la optimización:\n{message}")
+
+    def show_results(self, result, students, compat, seats, seat_distances, instance, room):
+        if result.stop_reason == 'cancelled':
+            self.progress_label.setText(f"⏹️ Cancelado en la generación {result.generations}; se muestra la mejor solución hasta ahora.")
+        else:
             self.progress_label.setText("✅ ¡Optimización completada!")
 
+        solutions = result.solutions
         if solutions:
-            SolutionDialog(solutions, self.students, seats, seat_distances, self.compat_matrix, self.window).exec()
-            if logbook:
-                plot_evolution(logbook)
+            # Las incompatibilidades también: si cambiaron, los afectados no quedan fijos.
+            self.last_run = {'names': [student.name for student in students],
+                             'assignment': list(solutions[0]), 'room': room,
+                             'conflicts': instance.conflict_edges}
+            SolutionDialog(solutions, students, seats, seat_distances, compat, self.window,
+                           instance=instance).exec()
         else:
-            QMessageBox.warning(self.window, "Sin Resultados", "El algoritmo no pudo encontrar una solución válida. Intenta de nuevo o ajusta los parámetros.")
\ No newline at end of file
+            QMessageBox.warning(self.window, "Sin Resultados", "El algoritmo no pudo encontrar una solución válida. Intenta de nuevo o ajusta los parámetros.")
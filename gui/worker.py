@@ -0,0 +1,41 @@
+# Ejecución del algoritmo genético en segundo plano para que la ventana no se congele.
+# El hilo solo calcula: cada generación se emite como señal y Qt la entrega en el hilo
+# de la interfaz, que es el único que toca los widgets.
+
+import threading
+
+from PySide6.QtCore import QThread, Signal
+
+class GAWorker(QThread):
+    """
+    Hilo que ejecuta `function(*args, on_generation=..., should_stop=..., **kwargs)`,
+    normalmente core.genetic.solve o reoptimize. Emite `progress(GenerationEvent)` por
+    generación y, al terminar, `succeeded(GAResult)` o `failed(mensaje)`. cancel() pide
+    detenerse antes de la siguiente generación; el resultado trae lo mejor hasta ese
+    momento con stop_reason 'cancelled'.
+    """
+    progress = Signal(object)
+    succeeded = Signal(object)
+    failed = Signal(str)
+
+    def __init__(self, function, *args, parent=None, **kwargs):
+        super().__init__(parent)
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def run(self):
+        try:
+            result = self.function(*self.args, on_generation=self.progress.emit,
+                                   should_stop=self._cancel.is_set, **self.kwargs)
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.succeeded.emit(result)
@@ -1,5 +1,67 @@
-from gui.window import SeatPlanApp
+import argparse
+import os
+import sys
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="SeatPlan - Optimizador de asientos con algoritmo genético.")
+    commands = parser.add_subparsers(dest='command')
+    commands.add_parser('gui', help="Abre la interfaz gráfica (opción por defecto).")
+
+    batch = commands.add_parser('batch', help="Resuelve sin interfaz todas las secciones de un directorio.")
+    batch.add_argument('directory', help="Directorio con pares students_<nombre>.csv / compatibility_<nombre>.csv")
+    batch.add_argument('-o', '--output', default='results', help="Directorio de salida (por defecto: results)")
+    batch.add_argument('--rows', type=int, default=5, help="Filas del aula")
+    batch.add_argument('--cols', type=int, default=6, help="Columnas del aula")
+    batch.add_argument('--first-distance', type=float, default=2.0, help="Distancia de la primera fila (m)")
+    batch.add_argument('--row-spacing', type=float, default=1.0, help="Distancia entre filas (m)")
+    batch.add_argument('--processes', type=int, default=None, help="Procesos del pool (por defecto: uno por núcleo)")
+    batch.add_argument('--seed', type=int, default=None, help="Semilla para resultados reproducibles")
+    batch.add_argument('--ngen', type=int, default=150, help="Máximo de generaciones")
+    batch.add_argument('--pop-size', type=int, default=200, help="Tamaño de la población")
+    batch.add_argument('--time-budget', type=float, default=None, help="Segundos máximos por sección")
+    batch.add_argument('--chart', choices=('png', 'svg', 'pdf'), default=None,
+                       help="Exporta también el plano de cada sección en este formato")
+    return parser
+
+def run_batch(args):
+    from core.batch import solve_directory
+
+    summaries = solve_directory(args.directory, args.output, rows=args.rows, cols=args.cols,
+                                first_distance=args.first_distance, row_spacing=args.row_spacing,
+                                processes=args.processes, seed=args.seed, ngen=args.ngen,
+                                pop_size=args.pop_size, time_budget=args.time_budget,
+                                chart_format=args.chart)
+    failed = 0
+    for summary in summaries:
+        if 'error' in summary:
+            failed += 1
+            print(f"[ERROR] {summary['name']}: {summary['error']}")
+        else:
+            print(f"[OK] {summary['name']}: fitness {summary['fitness']:.6f} "
+                  f"({summary['generations']} generaciones, {summary['elapsed']:.2f} s)")
+    print(f"{len(summaries) - failed} de {len(summaries)} secciones resueltas. Resultados en '{args.output}'.")
+    return 1 if failed else 0
+
+def run_gui():
+    # La interfaz (PySide6 y matplotlib) solo se importa si se va a usar.
+    from gui.window import SeatPlanApp
 
-if __name__ == "__main__":
     app = SeatPlanApp()
-    app.run()
\ No newline at end of file
+    app.run()
+    return 0
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == 'batch':
+        from core.datasets import find_datasets
+
+        if not os.path.isdir(args.directory):
+            parser.error(f"'{args.directory}' no es un directorio")
+        if not find_datasets(args.directory):
+            parser.error(f"'{args.directory}' no tiene pares students_<nombre>.csv / compatibility_<nombre>.csv")
+        return run_batch(args)
+    return run_gui()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+import os
+
+import pytest
+
+from core.checkpoint import load_checkpoint
+from core.datasets import compatibility_matrix, load_dataset
+from core.genetic import resume_ga, solve
+from core.instance import build_room
+
+DATASETS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'datasets')
+
+@pytest.fixture(scope='module')
+def problem():
+    students, _, pairs = load_dataset(os.path.join(DATASETS, 'students_dataset.csv'),
+                                      os.path.join(DATASETS, 'compatibility_dataset.csv'))
+    seats, seat_distances = build_room(8, 5)
+    return students, seats, compatibility_matrix(len(students), pairs), seat_distances, [1]
+
+@pytest.mark.parametrize('settings', [
+    {},
+    {'encoding': 'permutation', 'crossover': 'pmx', 'mutation': 'insert'},
+    {'local_search': 'generation'},
+    {'seeding': 'assignment', 'cache_size': 0},
+])
+def test_resume_matches_uninterrupted_run(problem, tmp_path, settings):
+    path = str(tmp_path / 'run.npz')
+    full = solve(*problem, ngen=30, pop_size=40, seed=5, verbose=False, **settings)
+    solve(*problem, ngen=12, pop_size=40, seed=5, verbose=False, checkpoint_path=path, checkpoint_interval=5,
+          **settings)
+    resumed = resume_ga(path, *problem, ngen=30, verbose=False)
+
+    assert resumed.solutions == full.solutions
+    assert resumed.fitness == full.fitness
+    assert resumed.evaluations == full.evaluations
+    assert resumed.logbook == full.logbook
+
+def test_empty_hall_of_fame_round_trip(problem, tmp_path):
+    path = str(tmp_path / 'run.npz')
+    solve(*problem, ngen=3, pop_size=20, seed=1, hof_size=0, verbose=False, checkpoint_path=path)
+    state = load_checkpoint(path)
+    assert len(state['hof']) == 0
+    resumed = resume_ga(path, *problem, ngen=6, verbose=False)
+    assert resumed.generations == 6
+    assert resumed.solutions == []
+
+def test_checkpoint_interval_must_be_positive(problem, tmp_path):
+    with pytest.raises(ValueError):
+        solve(*problem, ngen=3, verbose=False, checkpoint_path=str(tmp_path / 'run.npz'), checkpoint_interval=0)
@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from benchmarks.instances import generate_instance
+from core.delta import IncrementalEvaluator, swap_changes
+
+@pytest.mark.parametrize('seed', range(5))
+def test_incremental_fitness_matches_full_evaluation(seed):
+    instance = generate_instance(60, 8, 10, conflict_density=0.05, seed=seed).problem()
+    rng = np.random.default_rng(seed)
+    evaluator = IncrementalEvaluator(rng.permutation(instance.seats_count)[:instance.num_students], instance)
+    assert evaluator.fitness == pytest.approx(instance.evaluate(evaluator.chromosome), rel=1e-12)
+
+    for _ in range(300):
+        chromosome = list(evaluator.chromosome)
+        a = int(rng.integers(instance.num_students))
+        if rng.random() < 0.5:
+            changes = swap_changes(chromosome, a, int(rng.integers(instance.num_students)))
+        else:
+            # Movimiento a un asiento vacío.
+            empty = np.flatnonzero(evaluator.seat_counts == 0)
+            changes = [(a, int(rng.choice(empty)))]
+        candidate = list(chromosome)
+        for student, seat in changes:
+            candidate[student] = seat
+        expected = instance.evaluate(candidate)
+
+        assert evaluator.evaluate_changes(changes) == pytest.approx(expected, rel=1e-12)
+        assert evaluator.chromosome == chromosome
+        assert evaluator.apply_changes(changes) == pytest.approx(expected, rel=1e-12)
+        assert evaluator.chromosome == candidate
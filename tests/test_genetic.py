@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+
+from core.genetic import feasible, repair_batch
+
+@pytest.mark.parametrize('seed', range(20))
+def test_repair_batch_is_feasible_and_keeps_first_occurrences(seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(100):
+        n = int(rng.integers(1, 15))
+        seats_count = n + int(rng.integers(0, 6))
+        genes = rng.integers(0, seats_count, size=(int(rng.integers(1, 8)), n))
+        original = genes.copy()
+        repaired, fixed = repair_batch(genes, seats_count, rng)
+
+        first = np.zeros_like(original, dtype=bool)
+        for row, first_row in zip(original, first):
+            first_row[np.unique(row, return_index=True)[1]] = True
+        assert all(feasible(row.tolist()) for row in genes)
+        assert ((genes >= 0) & (genes < seats_count)).all()
+        assert (genes[first] == original[first]).all()
+        assert fixed == (~first).sum()
+        assert repaired == (~first).any(axis=1).sum()
@@ -0,0 +1,39 @@
+import os
+
+import numpy as np
+import pytest
+
+from core.datasets import compatibility_matrix, load_dataset
+from core.genetic import Individual, evaluate
+from core.instance import ProblemInstance, build_room, edges_from_pairs
+
+DATASETS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'datasets')
+
+@pytest.fixture(scope='module')
+def dataset():
+    return load_dataset(os.path.join(DATASETS, 'students_dataset.csv'),
+                        os.path.join(DATASETS, 'compatibility_dataset.csv'))
+
+@pytest.mark.parametrize('rows, cols', [(5, 6), (8, 5)])
+def test_evaluate_matches_original_fitness(dataset, rows, cols):
+    students, _, pairs = dataset
+    seats, seat_distances = build_room(rows, cols)
+    matrix = compatibility_matrix(len(students), pairs)
+    instance = ProblemInstance(students, seats, matrix, seat_distances)
+    rng = np.random.default_rng(0)
+    population = np.array([rng.permutation(len(seats))[:len(students)] for _ in range(50)])
+
+    expected = [evaluate(Individual(row.tolist()), students, seats, matrix, seat_distances, instance.d_max)
+                for row in population]
+    assert [instance.evaluate(row) for row in population] == pytest.approx(expected, rel=1e-12)
+    assert instance.evaluate_population(population) == pytest.approx(expected, rel=1e-12)
+
+def test_conflict_edges_match_compatibility_matrix(dataset):
+    students, _, pairs = dataset
+    seats, seat_distances = build_room(8, 5)
+    matrix = compatibility_matrix(len(students), pairs)
+    from_matrix = ProblemInstance(students, seats, matrix, seat_distances)
+    from_edges = ProblemInstance(students, seats, None, seat_distances, conflict_edges=edges_from_pairs(pairs))
+    rng = np.random.default_rng(1)
+    population = np.array([rng.permutation(len(seats))[:len(students)] for _ in range(20)])
+    assert from_edges.evaluate_population(population) == pytest.approx(from_matrix.evaluate_population(population))
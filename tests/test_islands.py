@@ -0,0 +1,28 @@
+import os
+
+import pytest
+
+from core.datasets import compatibility_matrix, load_dataset
+from core.instance import build_room
+from core.islands import run_islands
+
+DATASETS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'datasets')
+
+@pytest.fixture(scope='module')
+def problem():
+    students, _, pairs = load_dataset(os.path.join(DATASETS, 'students_dataset.csv'),
+                                      os.path.join(DATASETS, 'compatibility_dataset.csv'))
+    seats, seat_distances = build_room(8, 5)
+    return students, seats, compatibility_matrix(len(students), pairs), seat_distances, [1]
+
+@pytest.mark.parametrize('encoding', ['integer', 'permutation'])
+def test_result_does_not_depend_on_processes(problem, encoding):
+    settings = dict(ngen=12, pop_size=30, n_islands=3, migration_interval=4, seed=7, encoding=encoding,
+                    verbose=False)
+    serial = run_islands(*problem, processes=1, **settings)
+    parallel = run_islands(*problem, processes=3, **settings)
+    assert parallel == serial
+
+def test_same_seed_same_result(problem):
+    settings = dict(ngen=8, pop_size=20, n_islands=2, processes=1, verbose=False)
+    assert run_islands(*problem, seed=3, **settings) == run_islands(*problem, seed=3, **settings)
@@ -0,0 +1,56 @@
+from itertools import permutations
+
+import numpy as np
+import pytest
+
+from core.seeding import linear_assignment
+
+def brute_force_cost(cost):
+    n, m = cost.shape
+    return min(cost[np.arange(n), list(columns)].sum() for columns in permutations(range(m), n))
+
+def check_optimal(cost):
+    assignment = linear_assignment(cost)
+    n = cost.shape[0]
+    assert len(assignment) == n
+    assert len(set(assignment.tolist())) == n
+    assert cost[np.arange(n), assignment].sum() == pytest.approx(brute_force_cost(cost))
+
+@pytest.mark.parametrize('seed', range(30))
+def test_linear_assignment_random(seed):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(1, 6))
+    m = int(rng.integers(n, 7))
+    check_optimal(rng.random((n, m)))
+
+@pytest.mark.parametrize('seed', range(30))
+def test_linear_assignment_with_ties(seed):
+    # Filas y columnas repetidas, como estudiantes con la misma distancia óptima y
+    # asientos de la misma fila: se resuelve como problema de transporte entre tipos.
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(4, 7))
+    m = int(rng.integers(n, 8))
+    types = rng.integers(0, 4, size=(2, 3)).astype(float)
+    cost = types[np.ix_(rng.integers(0, 2, size=n), rng.integers(0, 3, size=m))]
+    check_optimal(cost)
+
+def test_linear_assignment_rejects_more_rows_than_columns():
+    with pytest.raises(ValueError):
+        linear_assignment(np.zeros((3, 2)))
+
+def test_unaffected_students_detects_changed_conflicts():
+    from core.instance import ProblemInstance, build_room
+    from core.models import Student
+    from core.seeding import unaffected_students
+
+    seats, seat_distances = build_room(5, 6)
+    students = [Student(f"E{i}", 0.0, i) for i in range(20)]
+    previous = np.arange(20)
+    # Mismo plano y misma lista, salvo una pareja incompatible nueva entre E0 y E19.
+    edges = (np.array([0]), np.array([19]))
+    instance = ProblemInstance(students, seats, None, seat_distances, conflict_edges=edges)
+    old_index = np.arange(20)
+    assert unaffected_students(instance, previous, previous, old_index).all()
+    unaffected = unaffected_students(instance, previous, previous, old_index,
+                                     previous_edges=(np.array([], dtype=int), np.array([], dtype=int)))
+    assert np.flatnonzero(~unaffected).tolist() == [0, 19]